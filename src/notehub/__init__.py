@@ -0,0 +1,4 @@
+"""notehub - use GitHub issues as notes."""
+
+# Help documentation URL (kept here so the CLI can use it without importing utils)
+HELP_URL = "https://github.com/Stabledog/notehub/blob/main/notehub-help.md"
@@ -1,5 +1,6 @@
 """Cache management for notehub - git-backed local issue storage."""
 
+import os
 import subprocess
 from datetime import datetime
 from pathlib import Path
@@ -206,6 +207,27 @@ def get_note_path(cache_path: Path) -> Path:
     return cache_path / "note.md"
 
 
+def _subdirs(path: str | os.PathLike) -> list[os.DirEntry]:
+    """
+    List subdirectories of path via os.scandir.
+
+    DirEntry.is_dir() reuses the file type reported by readdir, so no extra
+    stat() is needed per entry (except for symlinks, which are followed).
+    Unreadable directories are treated as empty, as the glob walk did.
+
+    Args:
+        path: Directory to list
+
+    Returns:
+        list: DirEntry for each subdirectory; empty if path can't be read
+    """
+    try:
+        with os.scandir(path) as entries:
+            return [entry for entry in entries if entry.is_dir()]
+    except OSError:
+        return []
+
+
 def find_all_cached_notes() -> list[tuple[str, str, str, int, Path]]:
     """
     Find all cached notes across all repos/orgs/hosts.
@@ -222,30 +244,27 @@ def find_all_cached_notes() -> list[tuple[str, str, str, int, Path]]:
     if not cache_root.exists():
         return results
 
-    # Use glob to find all .git directories matching our structure: host/org/repo/issue_number/.git
-    # This replaces 4 nested loops with a single glob pattern
-    for git_dir in cache_root.glob("*/*/*/*/.git"):
-        if not git_dir.is_dir():
-            continue
-
-        issue_dir = git_dir.parent
-        repo_dir = issue_dir.parent
-        org_dir = repo_dir.parent
-        host_dir = org_dir.parent
-
-        # Verify issue_number is actually a number
-        if not issue_dir.name.isdigit():
-            continue
-
-        results.append(
-            (
-                host_dir.name,
-                org_dir.name,
-                repo_dir.name,
-                int(issue_dir.name),
-                issue_dir,
-            )
-        )
+    # Walk host/org/repo/issue_number with scandir; only numeric issue
+    # directories get the one stat() needed to check for .git
+    for host_dir in _subdirs(cache_root):
+        for org_dir in _subdirs(host_dir.path):
+            for repo_dir in _subdirs(org_dir.path):
+                for issue_dir in _subdirs(repo_dir.path):
+                    # Verify issue_number is actually a number
+                    if not issue_dir.name.isdigit():
+                        continue
+                    if not os.path.isdir(os.path.join(issue_dir.path, ".git")):
+                        continue
+
+                    results.append(
+                        (
+                            host_dir.name,
+                            org_dir.name,
+                            repo_dir.name,
+                            int(issue_dir.name),
+                            Path(issue_dir.path),
+                        )
+                    )
 
     return results
 
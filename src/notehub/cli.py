@@ -1,8 +1,19 @@
 import argparse
+import functools
+import importlib
 import sys
 
-from .commands import add, edit, list, show, status, sync
-from .utils import HELP_URL
+from . import HELP_URL
+
+# One-line summary per subcommand, shared by the subparsers and the static top-level help
+COMMAND_HELP = {
+    "add": "Create a new note-issue",
+    "show": "Display note-header and URL for specified issues",
+    "status": "Show context, authentication status, and user identity",
+    "edit": "Edit note-issue body in $EDITOR",
+    "list": "List all note-issues",
+    "sync": "Commit and push cache changes to GitHub",
+}
 
 
 def add_store_arguments(parser):
@@ -19,28 +30,32 @@ def add_store_arguments(parser):
     )
 
 
-def create_parser() -> argparse.ArgumentParser:
-    """Build the argument parser with all subcommands."""
-    parser = argparse.ArgumentParser(
-        prog="notehub",
-        epilog=f"For comprehensive help, see: {HELP_URL}",
-    )
-    subparsers = parser.add_subparsers(dest="command", required=True)
+@functools.lru_cache(maxsize=1)
+def _store_parent() -> argparse.ArgumentParser:
+    """Parent parser holding the store arguments, built once and shared by all subcommands."""
+    parent = argparse.ArgumentParser(add_help=False)
+    add_store_arguments(parent)
+    return parent
 
-    # Add command
+
+def _build_add(subparsers):
+    """Add the 'add' subcommand parser."""
     add_parser = subparsers.add_parser(
         "add",
-        help="Create a new note-issue",
+        help=COMMAND_HELP["add"],
         epilog=f"For details, see: {HELP_URL}#command-add",
+        parents=[_store_parent()],
     )
-    add_store_arguments(add_parser)
-    add_parser.set_defaults(handler=add.run)
+    add_parser.set_defaults(handler="notehub.commands.add:run")
+
 
-    # Show command
+def _build_show(subparsers):
+    """Add the 'show' subcommand parser."""
     show_parser = subparsers.add_parser(
         "show",
-        help="Display note-header and URL for specified issues",
+        help=COMMAND_HELP["show"],
         epilog=f"For details, see: {HELP_URL}#command-show",
+        parents=[_store_parent()],
     )
     show_parser.add_argument(
         "note_idents",
@@ -48,42 +63,50 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="NOTE-IDENT",
         help="Issue number or title regex (one or more required)",
     )
-    add_store_arguments(show_parser)
-    show_parser.set_defaults(handler=show.run)
+    show_parser.set_defaults(handler="notehub.commands.show:run")
+
 
-    # Status command
+def _build_status(subparsers):
+    """Add the 'status' subcommand parser."""
     status_parser = subparsers.add_parser(
         "status",
-        help="Show context, authentication status, and user identity",
+        help=COMMAND_HELP["status"],
         epilog=f"For details, see: {HELP_URL}#command-status",
+        parents=[_store_parent()],
     )
-    add_store_arguments(status_parser)
-    status_parser.set_defaults(handler=status.run)
+    status_parser.set_defaults(handler="notehub.commands.status:run")
 
-    # Edit command
+
+def _build_edit(subparsers):
+    """Add the 'edit' subcommand parser."""
     edit_parser = subparsers.add_parser(
         "edit",
-        help="Edit note-issue body in $EDITOR",
+        help=COMMAND_HELP["edit"],
         epilog=f"For details, see: {HELP_URL}#command-edit",
+        parents=[_store_parent()],
     )
     edit_parser.add_argument("note_ident", metavar="NOTE-IDENT", help="Issue number or title regex")
-    add_store_arguments(edit_parser)
-    edit_parser.set_defaults(handler=edit.run)
+    edit_parser.set_defaults(handler="notehub.commands.edit:run")
+
 
-    # List command
+def _build_list(subparsers):
+    """Add the 'list' subcommand parser."""
     list_parser = subparsers.add_parser(
         "list",
-        help="List all note-issues",
+        help=COMMAND_HELP["list"],
         epilog=f"For details, see: {HELP_URL}#command-list",
+        parents=[_store_parent()],
     )
-    add_store_arguments(list_parser)
-    list_parser.set_defaults(handler=list.run)
+    list_parser.set_defaults(handler="notehub.commands.list:run")
+
 
-    # Sync command
+def _build_sync(subparsers):
+    """Add the 'sync' subcommand parser."""
     sync_parser = subparsers.add_parser(
         "sync",
-        help="Commit and push cache changes to GitHub",
+        help=COMMAND_HELP["sync"],
         epilog=f"For details, see: {HELP_URL}#command-sync",
+        parents=[_store_parent()],
     )
     sync_parser.add_argument(
         "--cached",
@@ -97,24 +120,198 @@ def create_parser() -> argparse.ArgumentParser:
         metavar="NOTE-IDENT",
         help="Issue number or title regex (required unless --cached is used)",
     )
-    add_store_arguments(sync_parser)
-    sync_parser.set_defaults(handler=sync.run)
+    sync_parser.set_defaults(handler="notehub.commands.sync:run")
+
+
+# Subcommand name -> builder, in the order shown by --help
+SUBCOMMANDS = {
+    "add": _build_add,
+    "show": _build_show,
+    "status": _build_status,
+    "edit": _build_edit,
+    "list": _build_list,
+    "sync": _build_sync,
+}
+
+
+def create_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """
+    Build the argument parser.
+
+    Args:
+        command: Subcommand about to be parsed. If it names a known subcommand,
+                 only that subparser is built; otherwise all of them are (needed
+                 for top-level --help and for argparse's invalid-choice error).
+
+    Returns:
+        argparse.ArgumentParser: Parser ready for parse_args()
+    """
+    parser = argparse.ArgumentParser(
+        prog="notehub",
+        epilog=f"For comprehensive help, see: {HELP_URL}",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    if command in SUBCOMMANDS:
+        SUBCOMMANDS[command](subparsers)
+    else:
+        for build in SUBCOMMANDS.values():
+            build(subparsers)
 
     return parser
 
 
+def _load_handler(spec: str):
+    """
+    Import a command handler on demand.
+
+    Args:
+        spec: Handler reference in "module:function" form
+
+    Returns:
+        Callable taking the parsed argparse.Namespace
+    """
+    module_name, _, func_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+# Options understood by _fast_parse: flag -> (dest, takes_value)
+_FAST_STORE_FLAGS = {
+    "--host": ("host", True),
+    "-H": ("host", True),
+    "--org": ("org", True),
+    "-o": ("org", True),
+    "--repo": ("repo", True),
+    "-r": ("repo", True),
+    "--global": ("global_scope", False),
+    "-g": ("global_scope", False),
+}
+_FAST_EXTRA_FLAGS = {
+    "sync": {"--cached": ("cached", False), "-c": ("cached", False)},
+}
+
+# Positional shape per subcommand: (dest, min count, max count)
+_FAST_POSITIONALS = {
+    "add": None,
+    "show": ("note_idents", 1, None),
+    "status": None,
+    "edit": ("note_ident", 1, 1),
+    "list": None,
+    "sync": ("note_ident", 0, 1),
+}
+
+
+def _fast_parse(argv: list[str]) -> argparse.Namespace | None:
+    """
+    Parse the common invocation shapes without argparse.
+
+    Produces the same Namespace argparse would. Anything unusual (help,
+    unknown or --flag=value options, misplaced or wrong number of
+    positionals) returns None so argparse can handle it, errors included.
+
+    Args:
+        argv: Command-line arguments (without program name)
+
+    Returns:
+        Parsed namespace, or None to fall back to argparse
+    """
+    command = argv[0]
+    if command not in _FAST_POSITIONALS:
+        return None
+
+    flags = {**_FAST_STORE_FLAGS, **_FAST_EXTRA_FLAGS.get(command, {})}
+    values = {dest: None for dest, takes_value in flags.values() if takes_value}
+    values.update({dest: False for dest, takes_value in flags.values() if not takes_value})
+    positionals = []
+    last_positional = None
+
+    i = 1
+    while i < len(argv):
+        arg = argv[i]
+        if arg.startswith("-"):
+            if arg not in flags:
+                return None
+            dest, takes_value = flags[arg]
+            if takes_value:
+                if i + 1 >= len(argv) or argv[i + 1].startswith("-"):
+                    return None
+                values[dest] = argv[i + 1]
+                i += 1
+            else:
+                values[dest] = True
+        else:
+            # argparse consumes positionals in one contiguous run
+            if positionals and last_positional != i - 1:
+                return None
+            positionals.append(arg)
+            last_positional = i
+        i += 1
+
+    shape = _FAST_POSITIONALS[command]
+    if shape is None:
+        if positionals:
+            return None
+    else:
+        dest, min_count, max_count = shape
+        if len(positionals) < min_count or (max_count is not None and len(positionals) > max_count):
+            return None
+        if max_count == 1:
+            values[dest] = positionals[0] if positionals else None
+        else:
+            values[dest] = positionals
+
+    return argparse.Namespace(command=command, handler=f"notehub.commands.{command}:run", **values)
+
+
+def format_top_level_help() -> str:
+    """
+    Render top-level help without building any parsers.
+
+    Mirrors argparse's layout for the top-level parser so that bare
+    `notehub` and `notehub --help` don't pay for parser construction.
+
+    Returns:
+        str: Help text
+    """
+    choices = ",".join(SUBCOMMANDS)
+    lines = [
+        f"usage: notehub [-h] {{{choices}}} ...",
+        "",
+        "positional arguments:",
+        f"  {{{choices}}}",
+    ]
+    lines += [f"    {name:<20}{COMMAND_HELP[name]}" for name in SUBCOMMANDS]
+    lines += [
+        "",
+        "options:",
+        "  -h, --help            show this help message and exit",
+        "",
+        f"For comprehensive help, see: {HELP_URL}",
+    ]
+    return "\n".join(lines)
+
+
 def main(args=None):
     """Parse arguments and dispatch to appropriate command."""
-    args = sys.argv[1:] if not args else args
-    parser = create_parser()
-
-    try:
-        parsed = parser.parse_args(args)
-    except SystemExit as e:
-        # argparse calls sys.exit() on error or after showing help
-        # Display help URL on errors (non-zero exit codes)
-        if e.code != 0:
-            print(f"\nFor comprehensive help, see: {HELP_URL}", file=sys.stderr)
-        raise
-
-    return parsed.handler(parsed)
+    args = sys.argv[1:] if args is None else args
+
+    # Fast path: top-level help needs no parsers at all
+    if not args or args[0] in ("-h", "--help"):
+        print(format_top_level_help())
+        return 0
+
+    # Common shapes skip argparse; everything else (and every error) goes through it
+    parsed = _fast_parse(args)
+    if parsed is None:
+        parser = create_parser(args[0])
+
+        try:
+            parsed = parser.parse_args(args)
+        except SystemExit as e:
+            # argparse calls sys.exit() on error or after showing help
+            # Display help URL on errors (non-zero exit codes)
+            if e.code != 0:
+                print(f"\nFor comprehensive help, see: {HELP_URL}", file=sys.stderr)
+            raise
+
+    return _load_handler(parsed.handler)(parsed)
@@ -17,7 +17,9 @@ def run(args: Namespace) -> int:
     """
     context = StoreContext.resolve(args)
 
-    # Ensure 'notehub' label exists before creating issue
+    # Ensure 'notehub' label exists before creating issue. This runs before gh
+    # takes over the terminal, so a failure is reported cleanly and stops the
+    # command before the user writes the note.
     if not ensure_label_exists(
         context.host,
         context.org,
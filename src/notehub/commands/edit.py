@@ -10,7 +10,7 @@ from argparse import Namespace
 from .. import cache
 from ..config import get_editor
 from ..context import StoreContext
-from ..gh_wrapper import GhError, get_issue, get_issue_metadata, update_issue
+from ..gh_wrapper import ISSUE_FIELDS, GhError, get_issue, get_issue_metadata, update_issue
 from ..utils import resolve_note_ident
 
 
@@ -158,7 +158,7 @@ def run(args: Namespace) -> int:
         # Initialize cache if it doesn't exist
         if not cache_path.exists():
             print(f"Creating cache for issue #{issue_num}...")
-            issue = get_issue(context.host, context.org, context.repo, issue_num)
+            issue = get_issue(context.host, context.org, context.repo, issue_num, fields=(*ISSUE_FIELDS, "updated_at"))
             content = issue.get("body") or ""
             updated_at = issue.get("updated_at")
 
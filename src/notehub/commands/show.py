@@ -4,10 +4,41 @@ import sys
 from argparse import Namespace
 
 from ..context import StoreContext
-from ..gh_wrapper import GhError, get_issue
+from ..gh_wrapper import GhError, get_issue, get_issues_batch, list_issues
 from ..utils import format_note_header, resolve_note_ident
 
 
+def _fetch_issues(context: StoreContext, issue_numbers: list[int]) -> tuple[dict[int, dict], dict[int, str]]:
+    """
+    Fetch issues by number, batching into one round-trip when there are several.
+
+    If the batch fails as a whole, each number is fetched on its own, so a
+    failure only affects the idents that refer to the failing issue.
+
+    Args:
+        context: Store context (host/org/repo)
+        issue_numbers: Issue numbers to fetch
+
+    Returns:
+        Tuple of (issue dict by number, gh error message by number)
+    """
+    numbers = list(dict.fromkeys(issue_numbers))
+    if len(numbers) > 1:
+        try:
+            return get_issues_batch(context.host, context.org, context.repo, numbers), {}
+        except GhError:
+            pass
+
+    issues = {}
+    errors = {}
+    for issue_num in numbers:
+        try:
+            issues[issue_num] = get_issue(context.host, context.org, context.repo, issue_num)
+        except GhError as e:
+            errors[issue_num] = e.stderr.strip()
+    return issues, errors
+
+
 def run(args: Namespace) -> int:
     """
     Execute show command.
@@ -21,31 +52,53 @@ def run(args: Namespace) -> int:
     context = StoreContext.resolve(args)
     any_errors = False
 
-    for i, ident in enumerate(args.note_idents):
+    # Title-regex idents all match against the same listing; fetch it once
+    all_issues = None
+    list_error = None
+    if any(not ident.isdigit() for ident in args.note_idents):
+        try:
+            all_issues = list_issues(context.host, context.org, context.repo, fields="number,title")
+        except GhError as e:
+            list_error = f"Failed to list issues: {e.stderr.strip()}"
+
+    # First pass: resolve every ident to an issue number
+    resolved = []
+    for ident in args.note_idents:
+        if list_error and not ident.isdigit():
+            resolved.append((ident, None, list_error))
+        else:
+            resolved.append((ident, *resolve_note_ident(context, ident, all_issues=all_issues)))
+
+    # Second pass: fetch all resolved issues together
+    issue_numbers = [issue_num for _, issue_num, error in resolved if not error]
+    issues, fetch_errors = _fetch_issues(context, issue_numbers) if issue_numbers else ({}, {})
+
+    for i, (ident, issue_num, error) in enumerate(resolved):
         # Add blank line between issues (except before first)
         if i > 0:
             print()
 
-        try:
-            issue_num, error = resolve_note_ident(context, ident)
-
-            if error:
-                print(f"Error: {error}", file=sys.stderr)
-                any_errors = True
-                continue
+        if error:
+            print(f"Error: {error}", file=sys.stderr)
+            any_errors = True
+            continue
 
-            # Fetch full issue data (includes html_url which list_issues uses 'url')
-            issue = get_issue(context.host, context.org, context.repo, issue_num)
+        if issue_num in fetch_errors:
+            print(f"Error processing '{ident}': {fetch_errors[issue_num]}", file=sys.stderr)
+            any_errors = True
+            continue
 
-            # Display note-header
-            print(format_note_header(issue))
+        issue = issues.get(issue_num)
+        if issue is None:
+            print(f"Error processing '{ident}': issue #{issue_num} not found", file=sys.stderr)
+            any_errors = True
+            continue
 
-            # Display URL (indented with 2 spaces)
-            url = issue["html_url"]
-            print(f"  {url}")
+        # Display note-header
+        print(format_note_header(issue))
 
-        except GhError as e:
-            print(f"Error processing '{ident}': {e.stderr.strip()}", file=sys.stderr)
-            any_errors = True
+        # Display URL (indented with 2 spaces)
+        url = issue["html_url"]
+        print(f"  {url}")
 
     return 1 if any_errors else 0
@@ -2,8 +2,8 @@ import os
 import subprocess
 from argparse import Namespace
 
-from ..context import StoreContext
-from ..gh_wrapper import check_gh_auth, check_gh_installed, get_gh_user
+from ..context import StoreContext, find_git_dir
+from ..gh_wrapper import check_gh_installed, get_auth_state
 from ..utils import HELP_URL
 
 
@@ -91,10 +91,9 @@ def run(args: Namespace) -> int:
     else:
         print("  Source: gh auth (stored credentials)")
 
-    is_authenticated = check_gh_auth(context.host)
+    is_authenticated, user = get_auth_state(context.host)
 
     if is_authenticated:
-        user = get_gh_user(context.host)
         print(f"  Status: ✓ Authenticated to {context.host}")
         if user:
             print(f"  User:   {user}")
@@ -120,12 +119,19 @@ def get_local_repo_path() -> str | None:
     """
     Get the root path of the local git repository, if in one.
 
+    Found by walking up from the current directory rather than running git.
+    When $GIT_DIR is set the work tree can be anywhere (or absent, for a bare
+    repo), so git is asked instead.
+
     Returns:
         str: Absolute path to repo root, or None if not in a git repo
     """
-    result = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True)
+    if os.environ.get("GIT_DIR"):
+        result = subprocess.run(["git", "rev-parse", "--show-toplevel"], capture_output=True, text=True, check=False)
+        return result.stdout.strip() if result.returncode == 0 else None
 
-    if result.returncode == 0:
-        return result.stdout.strip()
+    git_dir = find_git_dir()
+    if git_dir is None:
+        return None
 
-    return None
+    return str(git_dir.parent)
@@ -2,19 +2,69 @@
 
 import sys
 from argparse import Namespace
+from pathlib import Path
 
 from .. import cache
 from ..context import StoreContext
 from ..gh_wrapper import GhError, get_issue_metadata, update_issue
 from ..utils import resolve_note_ident
 
+# Most notes pushed at once by sync --cached. Kept below the read-fetch limit
+# because GitHub throttles concurrent writes more aggressively than reads.
+MAX_PARALLEL_PUSHES = 4
+
+
+def _sync_cached_note(host: str, org: str, repo: str, issue_num: int, cache_path: Path) -> tuple[str, str]:
+    """
+    Push one dirty cached note to GitHub.
+
+    Args:
+        host: GitHub host
+        org: Organization/owner name
+        repo: Repository name
+        issue_num: Issue number
+        cache_path: Cache directory of the note
+
+    Returns:
+        tuple: (outcome, message) where outcome is 'synced', 'skipped' or 'failed'
+    """
+    try:
+        # Commit if dirty
+        if cache.commit_if_dirty(cache_path):
+            pass  # Committed, continue with sync
+
+        # Read content
+        content = cache.get_note_content(cache_path)
+
+        # Push to GitHub
+        update_issue(host, org, repo, issue_num, content)
+
+        # Update timestamp
+        metadata = get_issue_metadata(host, org, repo, issue_num)
+        updated_at = metadata.get("updated_at")
+        if updated_at:
+            cache.set_last_known_updated_at(cache_path, updated_at)
+
+        return "synced", f"  {org}/{repo}#{issue_num}: Synced"
+
+    except GhError as e:
+        # Check if issue was deleted (404)
+        if "Not Found" in e.stderr or "404" in e.stderr:
+            return "skipped", f"  {org}/{repo}#{issue_num}: Skipped - issue deleted on GitHub"
+        return "failed", f"  {org}/{repo}#{issue_num}: Failed - {e.stderr.strip()}"
+
+    except Exception as e:
+        return "failed", f"  {org}/{repo}#{issue_num}: Failed - {str(e)}"
+
 
 def sync_all_dirty() -> int:
     """
     Sync all dirty cached notes across all repos/orgs/hosts.
 
     Discovers all cached notes with uncommitted changes and pushes them
-    to GitHub, continuing on individual failures.
+    to GitHub, continuing on individual failures. Notes are independent, so
+    they are pushed concurrently (up to MAX_PARALLEL_PUSHES at a time) and
+    reported in discovery order.
 
     Returns:
         0 if all succeeded, 1 if any errors occurred
@@ -26,43 +76,22 @@ def sync_all_dirty() -> int:
         return 0
 
     print(f"Found {len(dirty_notes)} dirty cached note(s). Syncing...")
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(dirty_notes), MAX_PARALLEL_PUSHES)) as pool:
+        outcomes = list(pool.map(lambda note: _sync_cached_note(*note), dirty_notes))
+
     errors = []
     synced_count = 0
-
-    for host, org, repo, issue_num, cache_path in dirty_notes:
-        try:
-            # Commit if dirty
-            if cache.commit_if_dirty(cache_path):
-                pass  # Committed, continue with sync
-
-            # Read content
-            content = cache.get_note_content(cache_path)
-
-            # Push to GitHub
-            update_issue(host, org, repo, issue_num, content)
-
-            # Update timestamp
-            metadata = get_issue_metadata(host, org, repo, issue_num)
-            updated_at = metadata.get("updated_at")
-            if updated_at:
-                cache.set_last_known_updated_at(cache_path, updated_at)
-
-            print(f"  {org}/{repo}#{issue_num}: Synced")
-            synced_count += 1
-
-        except GhError as e:
-            # Check if issue was deleted (404)
-            if "Not Found" in e.stderr or "404" in e.stderr:
-                print(f"  {org}/{repo}#{issue_num}: Skipped - issue deleted on GitHub")
-            else:
-                error_msg = f"  {org}/{repo}#{issue_num}: Failed - {e.stderr.strip()}"
-                print(error_msg, file=sys.stderr)
-                errors.append(error_msg)
-
-        except Exception as e:
-            error_msg = f"  {org}/{repo}#{issue_num}: Failed - {str(e)}"
-            print(error_msg, file=sys.stderr)
-            errors.append(error_msg)
+    for outcome, message in outcomes:
+        if outcome == "failed":
+            print(message, file=sys.stderr)
+            errors.append(message)
+        else:
+            print(message)
+            if outcome == "synced":
+                synced_count += 1
 
     # Print summary
     print(f"\nSynced {synced_count} note(s).")
@@ -3,10 +3,43 @@
 Determine host/org/repo from flags, config, and environment.
 """
 
+import functools
 import os
 import subprocess
 from argparse import Namespace
-from typing import Optional
+from pathlib import Path
+from types import MappingProxyType
+from typing import Mapping, Optional
+from urllib.parse import urlsplit
+
+# All notehub settings live under this git config section
+NOTEHUB_CONFIG_PATTERN = r"^notehub\."
+
+
+def find_git_dir(start: Optional[Path] = None) -> Optional[Path]:
+    """
+    Locate the enclosing git repository without spawning git.
+
+    Honors $GIT_DIR, then walks up from start looking for a `.git`
+    directory or gitfile (as used by worktrees and submodules).
+
+    Args:
+        start: Directory to search from (defaults to current directory)
+
+    Returns:
+        Path to the `.git` entry, or None if not inside a repository
+    """
+    git_dir = os.environ.get("GIT_DIR")
+    if git_dir:
+        return Path(git_dir)
+
+    path = (start or Path.cwd()).resolve()
+    for candidate in (path, *path.parents):
+        dot_git = candidate / ".git"
+        if dot_git.exists():
+            return dot_git
+
+    return None
 
 
 class StoreContext:
@@ -36,8 +69,16 @@ class StoreContext:
         Returns:
             StoreContext: Resolved context
         """
+        # Fully specified on the command line: nothing to look up
+        host, org, repo = (getattr(args, name, None) for name in ("host", "org", "repo"))
+        if host and org and repo and repo != ".":
+            return cls(host, org, repo)
+
         global_only = getattr(args, "global_scope", False)
 
+        # Start the independent git lookups together; resolvers then hit the caches
+        cls._prefetch_git_lookups(args, global_only)
+
         # Resolve host
         host = cls._resolve_host(args, global_only)
 
@@ -49,6 +90,43 @@ class StoreContext:
 
         return cls(host, org, repo)
 
+    @classmethod
+    def _prefetch_git_lookups(cls, args: Namespace, global_only: bool) -> None:
+        """
+        Run the git lookups the resolvers reach first concurrently to warm their caches.
+
+        Each lookup is a separate git process, so overlapping them cuts wall time
+        even under the GIL. Only each unresolved value's first lookup is
+        scheduled (local config inside a work tree, global config outside it,
+        the remote for --repo .); later fallbacks may never run, so they are
+        left to the resolvers. Nothing is started unless two different lookups
+        are due. Failures are left for the resolvers to repeat and handle.
+
+        Args:
+            args: Parsed command-line arguments
+            global_only: If True, skip local repo lookups
+        """
+        sources = (("host", "GH_HOST"), ("org", "NotehubOrg"), ("repo", "NotehubRepo"))
+        detect_repo = getattr(args, "repo", None) == "."
+        needs_config = any(
+            not getattr(args, name, None) and not os.environ.get(env_var)
+            for name, env_var in sources
+            if not (name == "repo" and detect_repo)
+        )
+        if not (detect_repo and needs_config):
+            # At most one distinct first lookup: nothing to overlap
+            return
+
+        # Outside a work tree the remote lookup returns without running git
+        if not find_git_dir():
+            return
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pool.submit(cls._get_git_remote_url)
+            pool.submit(cls._load_git_config, global_only)
+
     @classmethod
     def _resolve_host(cls, args: Namespace, global_only: bool) -> str:
         """Resolve host from args, git remote, config, or default."""
@@ -61,14 +139,14 @@ class StoreContext:
         if env_host:
             return env_host
 
-        # 3. Local git config notehub.host (unless --global)
-        if not global_only:
+        # Local lookups only make sense inside a work tree
+        if not global_only and find_git_dir():
+            # 3. Local git config notehub.host
             local_host = cls._get_git_config("notehub.host", global_only=False)
             if local_host:
                 return local_host
 
-        # 4. Auto-detect from git remote (unless --global)
-        if not global_only:
+            # 4. Auto-detect from git remote
             remote_host = cls._get_git_remote_host()
             if remote_host:
                 return remote_host
@@ -93,14 +171,14 @@ class StoreContext:
         if env_org:
             return env_org
 
-        # 3. Local git config notehub.org (unless --global)
-        if not global_only:
+        # Local lookups only make sense inside a work tree
+        if not global_only and find_git_dir():
+            # 3. Local git config notehub.org
             local_org = cls._get_git_config("notehub.org", global_only=False)
             if local_org:
                 return local_org
 
-        # 4. Auto-detect from git remote (unless --global)
-        if not global_only:
+            # 4. Auto-detect from git remote
             remote_org = cls._get_git_remote_org()
             if remote_org:
                 return remote_org
@@ -133,14 +211,14 @@ class StoreContext:
         if env_repo:
             return env_repo
 
-        # 3. Local git config notehub.repo (unless --global)
-        if not global_only:
+        # Local lookups only make sense inside a work tree
+        if not global_only and find_git_dir():
+            # 3. Local git config notehub.repo
             local_repo = cls._get_git_config("notehub.repo", global_only=False)
             if local_repo:
                 return local_repo
 
-        # 4. Auto-detect from git remote (unless --global)
-        if not global_only:
+            # 4. Auto-detect from git remote
             remote_repo = cls._get_git_remote_repo()
             if remote_repo:
                 return remote_repo
@@ -154,31 +232,67 @@ class StoreContext:
         return "notehub.default"
 
     @staticmethod
-    def _get_git_config(key: str, global_only: bool = False) -> Optional[str]:
+    def _load_git_config(global_only: bool = False) -> Mapping[str, str]:
         """
-        Get git config value.
+        Load every notehub.* git config entry with a single git call.
+
+        Local config is cached per repository, so resolving from another
+        directory never sees a previous repository's settings.
 
         Args:
-            key: Config key (e.g., 'notehub.host')
-            global_only: If True, only check global config
+            global_only: If True, only read global config
 
         Returns:
-            Config value or None if not set
+            Read-only mapping of lowercased config key to value (last value wins,
+            as with `git config <key>`); empty if nothing is set or git is unavailable
+        """
+        return StoreContext._read_git_config(global_only, None if global_only else find_git_dir())
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _read_git_config(global_only: bool, git_dir: Optional[Path]) -> Mapping[str, str]:
+        """
+        Run the bulk notehub.* config lookup behind _load_git_config.
+
+        Args:
+            global_only: If True, only read global config
+            git_dir: Repository the local lookup belongs to (cache key only)
+
+        Returns:
+            Read-only mapping of lowercased config key to value
         """
         cmd = ["git", "config"]
         if global_only:
             cmd.append("--global")
-        cmd.append(key)
+        cmd += ["--get-regexp", NOTEHUB_CONFIG_PATTERN]
 
+        values = {}
         try:
             result = subprocess.run(cmd, capture_output=True, text=True, check=False)
             if result.returncode == 0:
-                return result.stdout.strip()
+                for line in result.stdout.splitlines():
+                    key, _, value = line.partition(" ")
+                    if key:
+                        values[key.lower()] = value.strip()
         except FileNotFoundError:
             # git not installed
             pass
 
-        return None
+        return MappingProxyType(values)
+
+    @staticmethod
+    def _get_git_config(key: str, global_only: bool = False) -> Optional[str]:
+        """
+        Get git config value.
+
+        Args:
+            key: Config key (e.g., 'notehub.host')
+            global_only: If True, only check global config
+
+        Returns:
+            Config value or None if not set
+        """
+        return StoreContext._load_git_config(global_only).get(key.lower())
 
     @staticmethod
     def _expand_ssh_host(alias: str) -> Optional[str]:
@@ -217,10 +331,7 @@ class StoreContext:
         # First try git config insteadOf rules
         try:
             result = subprocess.run(
-                ["git", "config", "--get-regexp", r"^url\..*\.insteadof$"],
-                capture_output=True,
-                text=True,
-                check=False,
+                ["git", "config", "--get-regexp", r"^url\..*\.insteadof$"], capture_output=True, text=True, check=False
             )
             if result.returncode == 0:
                 for line in result.stdout.strip().split("\n"):
@@ -264,20 +375,14 @@ class StoreContext:
         try:
             # First, try to get current branch name
             result = subprocess.run(
-                ["git", "rev-parse", "--abbrev-ref", "HEAD"],
-                capture_output=True,
-                text=True,
-                check=False,
+                ["git", "rev-parse", "--abbrev-ref", "HEAD"], capture_output=True, text=True, check=False
             )
             if result.returncode == 0:
                 branch = result.stdout.strip()
 
                 # Get the remote for this branch
                 result = subprocess.run(
-                    ["git", "config", f"branch.{branch}.remote"],
-                    capture_output=True,
-                    text=True,
-                    check=False,
+                    ["git", "config", f"branch.{branch}.remote"], capture_output=True, text=True, check=False
                 )
                 if result.returncode == 0 and result.stdout.strip():
                     return result.stdout.strip()
@@ -288,44 +393,85 @@ class StoreContext:
         return "origin"
 
     @staticmethod
-    def _get_git_remote_host() -> Optional[str]:
+    def _get_git_remote_url() -> Optional[str]:
         """
-        Extract host from git remote URL.
+        Get the (insteadOf/SSH-expanded) URL of the current branch's remote.
+
+        Cached per repository so host, org and repo detection share a single lookup.
 
         Returns:
-            Host (e.g., 'github.com') or None if not detectable
+            Expanded remote URL or None if not in a git repo
+        """
+        git_dir = find_git_dir()
+        return StoreContext._read_git_remote_url(git_dir) if git_dir else None
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _read_git_remote_url(git_dir: Path) -> Optional[str]:
+        """
+        Run the remote URL lookup behind _get_git_remote_url.
+
+        Args:
+            git_dir: Repository the lookup belongs to (cache key only)
+
+        Returns:
+            Expanded remote URL or None if it can't be determined
         """
         try:
             remote = StoreContext._get_current_remote()
-            result = subprocess.run(
-                ["git", "remote", "get-url", remote],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+            result = subprocess.run(["git", "remote", "get-url", remote], capture_output=True, text=True, check=False)
             if result.returncode == 0:
-                url = result.stdout.strip()
                 # Expand URL using insteadOf rules
-                url = StoreContext._expand_git_url(url)
-
-                # Parse URL - handle both HTTPS and SSH formats
-                # HTTPS: https://github.com/org/repo.git
-                # SSH: git@github.com:org/repo.git
-                if url.startswith("https://"):
-                    # Extract host from https://host/...
-                    parts = url.split("//")
-                    if len(parts) > 1:
-                        host_part = parts[1].split("/")[0]
-                        return host_part
-                elif "@" in url:
-                    # Extract host from git@host:...
-                    host_part = url.split("@")[1].split(":")[0]
-                    return host_part
+                return StoreContext._expand_git_url(result.stdout.strip())
         except FileNotFoundError:
             pass
 
         return None
 
+    @staticmethod
+    @functools.lru_cache(maxsize=8)
+    def _parse_remote_url(url: str) -> tuple[Optional[str], Optional[str], Optional[str]]:
+        """
+        Split a git remote URL into host, org and repo in one pass.
+
+        Handles scheme URLs (https://github.com/org/repo.git,
+        ssh://git@host/org/repo) and scp-like SSH (git@github.com:org/repo.git).
+        A short form without a user (ghenterprise:org/repo) yields no host,
+        since an unexpanded alias is not a usable hostname.
+
+        Args:
+            url: Expanded remote URL
+
+        Returns:
+            Tuple of (host, org, repo); parts that can't be determined are None
+        """
+        if "://" in url:
+            parts = urlsplit(url)
+            host = parts.hostname
+            if not host:
+                return None, None, None
+            path = parts.path
+        else:
+            head, sep, path = url.partition(":")
+            host = head.rpartition("@")[2] if "@" in head else None
+            if not sep:
+                return host or None, None, None
+
+        org, _, rest = path.lstrip("/").partition("/")
+        repo = rest.split("/", 1)[0].removesuffix(".git")
+        return host or None, org or None, repo or None
+
+    @staticmethod
+    def _get_git_remote_host() -> Optional[str]:
+        """
+        Extract host from git remote URL.
+
+        Returns:
+            Host (e.g., 'github.com') or None if not detectable
+        """
+        url = StoreContext._get_git_remote_url()
+        return StoreContext._parse_remote_url(url)[0] if url else None
+
     @staticmethod
     def _get_git_remote_org() -> Optional[str]:
         """
@@ -334,44 +480,8 @@ class StoreContext:
         Returns:
             Organization name or None if not detectable
         """
-        try:
-            remote = StoreContext._get_current_remote()
-            result = subprocess.run(
-                ["git", "remote", "get-url", remote],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                # Expand URL using insteadOf rules
-                url = StoreContext._expand_git_url(url)
-
-                # Parse URL
-                # HTTPS: https://github.com/org/repo.git -> org
-                # SSH: git@github.com:org/repo.git -> org
-                # SCP-like: ghenterprise:org/repo.git -> org
-                if url.startswith("https://"):
-                    parts = url.split("//")
-                    if len(parts) > 1:
-                        path_parts = parts[1].split("/")[1:]  # Skip host
-                        if path_parts:
-                            return path_parts[0]
-                elif ":" in url:
-                    # Handle both SSH (git@host:org/repo) and SCP-like (host:org/repo)
-                    if "@" in url:
-                        # SSH format: git@github.com:org/repo.git
-                        path = url.split(":")[1]
-                    else:
-                        # SCP-like format: ghenterprise:org/repo.git
-                        path = url.split(":", 1)[1]
-
-                    org = path.split("/")[0]
-                    return org
-        except FileNotFoundError:
-            pass
-
-        return None
+        url = StoreContext._get_git_remote_url()
+        return StoreContext._parse_remote_url(url)[1] if url else None
 
     @staticmethod
     def _get_git_remote_repo() -> Optional[str]:
@@ -381,47 +491,8 @@ class StoreContext:
         Returns:
             Repository name or None if not detectable
         """
-        try:
-            remote = StoreContext._get_current_remote()
-            result = subprocess.run(
-                ["git", "remote", "get-url", remote],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-            if result.returncode == 0:
-                url = result.stdout.strip()
-                # Expand URL using insteadOf rules
-                url = StoreContext._expand_git_url(url)
-
-                # Parse URL - handle both HTTPS and SSH formats
-                # HTTPS: https://github.com/org/repo.git -> repo
-                # SSH: git@github.com:org/repo.git -> repo
-                # SCP-like: ghenterprise:org/repo.git -> repo
-                if url.startswith("https://"):
-                    parts = url.split("//")
-                    if len(parts) > 1:
-                        path_parts = parts[1].split("/")[2:]  # Skip host and org
-                        if path_parts:
-                            repo = path_parts[0].removesuffix(".git")
-                            return repo
-                elif ":" in url:
-                    # Handle both SSH (git@host:org/repo) and SCP-like (host:org/repo)
-                    if "@" in url:
-                        # SSH format: git@github.com:org/repo.git
-                        path = url.split(":")[1]
-                    else:
-                        # SCP-like format: ghenterprise:org/repo.git
-                        path = url.split(":", 1)[1]
-
-                    # Extract repo from org/repo.git
-                    if "/" in path:
-                        repo = path.split("/")[1].removesuffix(".git")
-                        return repo
-        except FileNotFoundError:
-            pass
-
-        return None
+        url = StoreContext._get_git_remote_url()
+        return StoreContext._parse_remote_url(url)[2] if url else None
 
     def repo_identifier(self) -> str:
         """
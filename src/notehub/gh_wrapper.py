@@ -1,8 +1,18 @@
+import functools
 import json
 import os
 import subprocess
 import sys
-from dataclasses import dataclass
+import threading
+import time
+from typing import NamedTuple
+
+try:
+    # Optional faster parser (pip install lm-notehub[fast]); its JSONDecodeError
+    # subclasses json.JSONDecodeError, so existing handlers still apply
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
 
 
 class GhError(Exception):
@@ -14,8 +24,7 @@ class GhError(Exception):
         super().__init__(f"gh CLI failed with exit code {returncode}")
 
 
-@dataclass
-class GhResult:
+class GhResult(NamedTuple):
     """Result from gh CLI invocation."""
 
     returncode: int
@@ -23,6 +32,84 @@ class GhResult:
     stderr: str
 
 
+def _ttl_cache(seconds: float, maxsize: int = 256):
+    """
+    Memoize a function's results for a limited time.
+
+    Like functools.lru_cache (including cache_clear()), but entries expire after
+    `seconds` so a long-lived process doesn't keep serving stale GitHub data.
+    Exceptions are not cached. The wrapper also gets cache_evict(*args) to drop
+    every entry whose leading arguments match. Safe to call from several threads.
+
+    Args:
+        seconds: How long a result stays valid
+        maxsize: Maximum number of entries; the oldest is dropped when full
+    """
+
+    def decorator(func):
+        cache = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args + tuple(sorted(kwargs.items()))
+            now = time.monotonic()
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+
+            value = func(*args, **kwargs)
+            with lock:
+                cache.pop(key, None)
+                if len(cache) >= maxsize:
+                    del cache[next(iter(cache))]
+                cache[key] = (now + seconds, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        def cache_evict(*args):
+            with lock:
+                for key in [key for key in cache if key[: len(args)] == args]:
+                    del cache[key]
+
+        wrapper.cache_clear = cache_clear
+        wrapper.cache_evict = cache_evict
+        return wrapper
+
+    return decorator
+
+
+# Environment variables gh reads credentials from; a change to any of them
+# invalidates the cached subprocess environment
+GH_TOKEN_VARS = ("GH_ENTERPRISE_TOKEN_2", "GH_ENTERPRISE_TOKEN", "GH_TOKEN", "GITHUB_TOKEN")
+
+
+@functools.lru_cache(maxsize=8)
+def _env_for_host(host: str, token_fingerprint: tuple = ()) -> dict:
+    """
+    Build the gh subprocess environment for a host once per process.
+
+    The returned dict is shared between calls; callers must not mutate it.
+
+    Args:
+        host: GitHub hostname (e.g., 'github.com' or 'github.enterprise.com')
+        token_fingerprint: Current values of GH_TOKEN_VARS; part of the cache
+                           key so credential changes take effect
+
+    Returns:
+        Copy of os.environ with GH_HOST set to host
+    """
+    env = os.environ.copy()
+
+    # Set GH_HOST to target the correct GitHub instance
+    env["GH_HOST"] = host
+    return env
+
+
 def _prepare_gh_cmd(host: str, base_cmd: list[str]) -> tuple[list[str], dict]:
     """
     Prepare gh command using gh.sh or ghe.sh wrapper (from gh-doctor dotkit).
@@ -35,12 +122,9 @@ def _prepare_gh_cmd(host: str, base_cmd: list[str]) -> tuple[list[str], dict]:
         base_cmd: Base gh command (e.g., ["gh", "api", "..."])
 
     Returns:
-        tuple: (command as list, environment dict)
+        tuple: (command as list, shared environment dict - do not mutate)
     """
-    env = os.environ.copy()
-
-    # Set GH_HOST to target the correct GitHub instance
-    env["GH_HOST"] = host
+    env = _env_for_host(host, tuple(os.environ.get(name) for name in GH_TOKEN_VARS))
 
     # Replace 'gh' with appropriate wrapper:
     # - gh.sh for github.com
@@ -63,6 +147,7 @@ def _run_gh_command(
     stdin=None,
     stdout=None,
     stderr=None,
+    text: bool = True,
 ) -> subprocess.CompletedProcess:
     """
     Execute gh command through shell (delegates to gh() function from gh-doctor dotkit).
@@ -76,11 +161,16 @@ def _run_gh_command(
         host: GitHub hostname (unused, kept for API compatibility)
         capture_output: Whether to capture stdout/stderr
         stdin/stdout/stderr: Optional I/O redirection
+        text: If False, leave captured stdout as bytes (for JSON parsing without
+              a decode pass); stderr is always decoded
 
     Returns:
         subprocess.CompletedProcess result
     """
-    if capture_output:
+    if capture_output and not text:
+        result = subprocess.run(cmd, capture_output=True, env=env)
+        result.stderr = result.stderr.decode(errors="replace")
+    elif capture_output:
         result = subprocess.run(cmd, capture_output=True, text=True, env=env, errors="replace")
     else:
         result = subprocess.run(cmd, stdin=stdin, stdout=stdout, stderr=stderr, env=env)
@@ -111,9 +201,11 @@ def create_issue(
     repo: str,
     interactive: bool = True,
     labels: list[str] | None = None,
+    title: str = "",
+    body: str = "",
 ) -> GhResult:
     """
-    Invoke gh issue create in interactive mode.
+    Invoke gh issue create, interactively or with a given title and body.
 
     Args:
         host: GitHub host
@@ -121,9 +213,12 @@ def create_issue(
         repo: Repository name
         interactive: If True, pass stdin/stdout/stderr to user terminal
         labels: List of label names to apply to the issue
+        title: Issue title (non-interactive mode)
+        body: Issue body (non-interactive mode)
 
     Returns:
-        GhResult: Result (stdout/stderr will be empty in interactive mode)
+        GhResult: Result; in non-interactive mode stdout holds the new issue URL
+                  (stdout/stderr are empty in interactive mode)
 
     Raises:
         GhError: If gh command fails
@@ -136,6 +231,10 @@ def create_issue(
         for label in labels:
             base_cmd.extend(["--label", label])
 
+    if not interactive:
+        # gh refuses to prompt without a TTY, so title and body must be given
+        base_cmd.extend(["--title", title, "--body", body])
+
     cmd, env = _prepare_gh_cmd(host, base_cmd)
 
     if interactive:
@@ -149,37 +248,49 @@ def create_issue(
             stdout=sys.stdout,
             stderr=sys.stderr,
         )
-    else:
-        result = _run_gh_command(cmd, env, host)
+        if result.returncode != 0:
+            raise GhError(result.returncode, "")
+        return GhResult(returncode=result.returncode, stdout="", stderr="")
+
+    result = _run_gh_command(cmd, env, host)
 
     if result.returncode != 0:
-        raise GhError(result.returncode, "")
+        print(result.stderr, file=sys.stderr)
+        raise GhError(result.returncode, result.stderr)
+
+    return GhResult(returncode=result.returncode, stdout=result.stdout.strip(), stderr=result.stderr)
+
 
-    return GhResult(
-        returncode=result.returncode,
-        stdout="",  # Empty in interactive mode
-        stderr="",
-    )
+# Issue fields get_issue() returns unless the caller asks for others
+ISSUE_FIELDS = ("number", "title", "html_url", "body")
 
 
-def get_issue(host: str, org: str, repo: str, issue_number: int) -> dict:
+@_ttl_cache(seconds=30)
+def get_issue(host: str, org: str, repo: str, issue_number: int, fields: tuple[str, ...] = ISSUE_FIELDS) -> dict:
     """
     Fetch issue JSON via gh api.
 
+    Only the requested top-level fields are kept (via --jq), so large issue
+    payloads are trimmed by gh before they reach Python.
+
+    Cached per (host, org, repo, issue_number, fields) for 30 seconds;
+    update_issue() evicts the updated issue. Callers must not mutate the result.
+
     Args:
         host: GitHub host (e.g., 'github.com')
         org: Organization or user name
         repo: Repository name
         issue_number: Issue number
+        fields: REST issue fields to return (a tuple, so results can be cached)
 
     Returns:
-        Issue dict with: number, title, html_url, body
+        Issue dict with the requested fields (default: number, title, html_url, body)
 
     Raises:
         GhError: If gh command fails
     """
     # Use --jq to filter to only the fields we need
-    jq_filter = "{number: .number, title: .title, html_url: .html_url, body: .body}"
+    jq_filter = "{" + ", ".join(f"{field}: .{field}" for field in fields) + "}"
     base_cmd = [
         "gh",
         "api",
@@ -189,7 +300,7 @@ def get_issue(host: str, org: str, repo: str, issue_number: int) -> dict:
     ]
 
     cmd, env = _prepare_gh_cmd(host, base_cmd)
-    result = _run_gh_command(cmd, env, host)
+    result = _run_gh_command(cmd, env, host, text=False)
 
     if result.returncode != 0:
         print(result.stderr, file=sys.stderr)
@@ -201,12 +312,179 @@ def get_issue(host: str, org: str, repo: str, issue_number: int) -> dict:
         raise GhError(1, error_msg)
 
     try:
-        return json.loads(result.stdout)
+        return _loads(result.stdout)
+    except json.JSONDecodeError as e:
+        error_msg = f"Invalid response from GitHub server at {host}: {str(e)}"
+        print(error_msg, file=sys.stderr)
+        raise GhError(1, error_msg) from e
+
+
+# Issues fetched per GraphQL request; keeps query size and server cost bounded
+GRAPHQL_BATCH_SIZE = 20
+
+# Upper bound on concurrent gh processes when several requests are needed
+MAX_PARALLEL_FETCHES = 8
+
+
+def _map_concurrently(func, items: list) -> list:
+    """
+    Apply func to each item, overlapping the calls in threads when there are several.
+
+    The work is gh subprocesses waiting on the network, so threads overlap it
+    despite the GIL. Results keep the order of items; the first exception raised
+    by func propagates.
+
+    Args:
+        func: Callable taking one item
+        items: Items to apply func to; at most MAX_PARALLEL_FETCHES run at once
+
+    Returns:
+        list: func(item) for each item, in the order of items
+    """
+    if len(items) < 2:
+        return [func(item) for item in items]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_PARALLEL_FETCHES)) as pool:
+        return list(pool.map(func, items))
+
+
+def _fetch_graphql_batch(host: str, org: str, repo: str, batch: list[int]) -> tuple[dict[int, dict], list[int]]:
+    """
+    Run one aliased GraphQL query for a batch of issue numbers.
+
+    Args:
+        host: GitHub host (e.g., 'github.com')
+        org: Organization or user name
+        repo: Repository name
+        batch: Issue numbers to request, at most GRAPHQL_BATCH_SIZE
+
+    Returns:
+        tuple: (issues, fallback) where issues maps issue number to dict with
+        number, title, html_url for every number GraphQL resolved, and fallback
+        lists the numbers to retry via REST (pull requests, missing issues, or
+        the whole batch if the query was rejected)
+
+    Raises:
+        GhError: If gh command fails or the repository cannot be resolved
+    """
+    fields = " ".join(f"i{n}: issue(number: {n}) {{ number title url }}" for n in batch)
+    query = f"query($owner: String!, $name: String!) {{ repository(owner: $owner, name: $name) {{ {fields} }} }}"
+    base_cmd = [
+        "gh",
+        "api",
+        "graphql",
+        "-f",
+        f"query={query}",
+        "-f",
+        f"owner={org}",
+        "-f",
+        f"name={repo}",
+    ]
+
+    cmd, env = _prepare_gh_cmd(host, base_cmd)
+    result = _run_gh_command(cmd, env, host, text=False)
+
+    if not result.stdout:
+        if result.returncode != 0:
+            print(result.stderr, file=sys.stderr)
+            raise GhError(result.returncode, result.stderr)
+        error_msg = f"No response from GitHub server at {host}. Check your network connection."
+        print(error_msg, file=sys.stderr)
+        raise GhError(1, error_msg)
+
+    try:
+        response = _loads(result.stdout)
     except json.JSONDecodeError as e:
         error_msg = f"Invalid response from GitHub server at {host}: {str(e)}"
         print(error_msg, file=sys.stderr)
         raise GhError(1, error_msg) from e
 
+    data = response.get("data")
+    if data is None:
+        if "errors" not in response:
+            # HTTP-level failure (e.g. bad credentials); REST would fail the same way
+            error_msg = response.get("message") or result.stderr
+            print(error_msg, file=sys.stderr)
+            raise GhError(result.returncode or 1, error_msg)
+        # Query rejected as a whole (e.g. older GHES schema): use REST for the batch
+        return {}, batch
+
+    # gh exits non-zero when any alias fails (e.g. NOT_FOUND), but still
+    # returns data for the rest; only a missing repository is fatal.
+    repository = data.get("repository")
+    if repository is None:
+        messages = "; ".join(err.get("message", "") for err in response.get("errors", []))
+        error_msg = messages or result.stderr
+        print(error_msg, file=sys.stderr)
+        raise GhError(result.returncode or 1, error_msg)
+
+    issues = {}
+    fallback = []
+    for n in batch:
+        node = repository.get(f"i{n}")
+        if node:
+            issues[n] = {"number": node["number"], "title": node["title"], "html_url": node["url"]}
+        else:
+            fallback.append(n)
+    return issues, fallback
+
+
+def get_issues_batch(host: str, org: str, repo: str, issue_numbers: list[int]) -> dict[int, dict]:
+    """
+    Fetch several issues with one GraphQL request per batch of issue numbers.
+
+    Each issue is requested under an alias (i42: issue(number: 42) {...}), so N
+    issues cost one round-trip per GRAPHQL_BATCH_SIZE instead of N. When more
+    than one request is needed (several batches, or REST retries) they run
+    concurrently, up to MAX_PARALLEL_FETCHES at a time.
+
+    Args:
+        host: GitHub host (e.g., 'github.com')
+        org: Organization or user name
+        repo: Repository name
+        issue_numbers: Issue numbers to fetch
+
+    Numbers GraphQL cannot resolve (including pull requests) and batches
+    rejected with GraphQL errors are retried one at a time via get_issue().
+
+    Returns:
+        Dict mapping issue number to dict with: number, title, html_url.
+        Numbers that do not resolve to an issue are omitted.
+
+    Raises:
+        GhError: If gh command fails or the repository cannot be resolved
+    """
+    numbers = list(dict.fromkeys(issue_numbers))
+    batches = [numbers[start : start + GRAPHQL_BATCH_SIZE] for start in range(0, len(numbers), GRAPHQL_BATCH_SIZE)]
+
+    issues = {}
+    fallback = []
+    for batch_issues, batch_fallback in _map_concurrently(
+        lambda batch: _fetch_graphql_batch(host, org, repo, batch), batches
+    ):
+        issues.update(batch_issues)
+        fallback += batch_fallback
+
+    # GraphQL's issue() doesn't resolve pull request numbers, which the REST
+    # issues endpoint does; retry unresolved numbers there to match get_issue()
+    def fetch_rest(n):
+        try:
+            return get_issue(host, org, repo, n)
+        except GhError as e:
+            # Only a missing issue is omitted; auth, network and rate-limit errors propagate
+            if "HTTP 404" in e.stderr or "Not Found" in e.stderr or "Could not resolve" in e.stderr:
+                return None
+            raise
+
+    for n, issue in zip(fallback, _map_concurrently(fetch_rest, fallback)):
+        if issue is not None:
+            issues[n] = issue
+
+    # Report in request order regardless of completion order
+    return {n: issues[n] for n in numbers if n in issues}
+
 
 def get_issue_metadata(host: str, org: str, repo: str, issue_number: int) -> dict:
     """
@@ -236,7 +514,7 @@ def get_issue_metadata(host: str, org: str, repo: str, issue_number: int) -> dic
     ]
 
     cmd, env = _prepare_gh_cmd(host, base_cmd)
-    result = _run_gh_command(cmd, env, host)
+    result = _run_gh_command(cmd, env, host, text=False)
 
     if result.returncode != 0:
         print(result.stderr, file=sys.stderr)
@@ -248,7 +526,7 @@ def get_issue_metadata(host: str, org: str, repo: str, issue_number: int) -> dic
         raise GhError(1, error_msg)
 
     try:
-        return json.loads(result.stdout)
+        return _loads(result.stdout)
     except json.JSONDecodeError as e:
         error_msg = f"Invalid response from GitHub server at {host}: {str(e)}"
         print(error_msg, file=sys.stderr)
@@ -296,7 +574,7 @@ def list_issues(
     ]
 
     cmd, env = _prepare_gh_cmd(host, base_cmd)
-    result = _run_gh_command(cmd, env, host)
+    result = _run_gh_command(cmd, env, host, text=False)
 
     if result.returncode != 0:
         print(result.stderr, file=sys.stderr)
@@ -309,64 +587,88 @@ def list_issues(
         raise GhError(1, error_msg)
 
     try:
-        return json.loads(result.stdout)
+        return _loads(result.stdout)
     except json.JSONDecodeError as e:
         error_msg = f"Invalid response from GitHub server at {host}: {str(e)}"
         print(error_msg, file=sys.stderr)
         raise GhError(1, error_msg) from e
 
 
-def check_gh_auth(host: str = "github.com") -> bool:
+@_ttl_cache(seconds=300, maxsize=32)
+def _auth_state(host: str, token_fingerprint: tuple) -> tuple[bool, str | None]:
     """
-    Check if gh is authenticated for the specified host by attempting a real operation.
-
-    Uses 'gh repo list --limit 1' as a lightweight test that requires authentication.
+    Run 'gh api user' for get_auth_state, cached for 5 minutes.
 
     Args:
         host: GitHub host (e.g., 'github.com' or 'github.enterprise.com')
+        token_fingerprint: Current values of GH_TOKEN_VARS; part of the cache
+                           key so credential changes take effect
 
     Returns:
-        bool: True if authenticated, False otherwise
+        tuple: (True, username) if authenticated, (False, None) otherwise
     """
-    base_cmd = ["gh", "repo", "list", "--limit", "1"]
+    base_cmd = ["gh", "api", "user", "--jq", ".login"]
     cmd, env = _prepare_gh_cmd(host, base_cmd)
 
     try:
         result = _run_gh_command(cmd, env, host)
-    except GhError:
-        return False
+    except Exception:
+        return (False, None)
 
     if result.returncode != 0:
         # Pass through any errors to console
         if result.stderr:
             print(result.stderr, file=sys.stderr, end="")
-        return False
+        return (False, None)
 
-    return True
+    return (True, result.stdout.strip() or None)
 
 
-def get_gh_user(host: str = "github.com") -> str | None:
+def get_auth_state(host: str = "github.com") -> tuple[bool, str | None]:
     """
-    Get the authenticated username for the specified host.
+    Check authentication and fetch the username with a single gh call.
+
+    'gh api user' fails when gh is not authenticated for the host, so one
+    invocation answers both questions. Successful checks are cached per host
+    and credentials for 5 minutes; failures are checked again on every call.
 
     Args:
         host: GitHub host (e.g., 'github.com' or 'github.enterprise.com')
 
     Returns:
-        str: Username if authenticated, None otherwise
+        tuple: (True, username) if authenticated, (False, None) otherwise
     """
-    try:
-        base_cmd = ["gh", "api", "user", "--jq", ".login"]
-        cmd, env = _prepare_gh_cmd(host, base_cmd)
+    token_fingerprint = tuple(os.environ.get(name) for name in GH_TOKEN_VARS)
+    state = _auth_state(host, token_fingerprint)
+    if not state[0]:
+        _auth_state.cache_evict(host, token_fingerprint)
+    return state
 
-        result = _run_gh_command(cmd, env, host)
 
-        if result.returncode == 0:
-            return result.stdout.strip()
-    except Exception:
-        pass
+def check_gh_auth(host: str = "github.com") -> bool:
+    """
+    Check if gh is authenticated for the specified host.
+
+    Args:
+        host: GitHub host (e.g., 'github.com' or 'github.enterprise.com')
+
+    Returns:
+        bool: True if authenticated, False otherwise
+    """
+    return get_auth_state(host)[0]
 
-    return None
+
+def get_gh_user(host: str = "github.com") -> str | None:
+    """
+    Get the authenticated username for the specified host.
+
+    Args:
+        host: GitHub host (e.g., 'github.com' or 'github.enterprise.com')
+
+    Returns:
+        str: Username if authenticated, None otherwise
+    """
+    return get_auth_state(host)[1]
 
 
 def check_gh_installed() -> bool:
@@ -414,7 +716,7 @@ def ensure_label_exists(host: str, org: str, repo: str, label_name: str, color:
     cmd, env = _prepare_gh_cmd(host, base_cmd)
 
     try:
-        result = _run_gh_command(cmd, env, host)
+        result = _run_gh_command(cmd, env, host, text=False)
     except GhError:
         return False
 
@@ -426,7 +728,7 @@ def ensure_label_exists(host: str, org: str, repo: str, label_name: str, color:
     if result.returncode != 0:
         # Try parsing stdout as JSON to check for already_exists error
         try:
-            error_data = json.loads(result.stdout)
+            error_data = _loads(result.stdout)
             if "errors" in error_data:
                 for error in error_data["errors"]:
                     if error.get("code") == "already_exists":
@@ -436,7 +738,7 @@ def ensure_label_exists(host: str, org: str, repo: str, label_name: str, color:
 
     # Real error - print it and return False
     if result.stdout:
-        print(result.stdout, file=sys.stderr, end="")
+        print(result.stdout.decode(errors="replace"), file=sys.stderr, end="")
     return False
 
 
@@ -472,6 +774,9 @@ def update_issue(host: str, org: str, repo: str, issue_number: int, body: str) -
     cmd, env = _prepare_gh_cmd(host, base_cmd)
     result = _run_gh_command(cmd, env, host)
 
+    # Any cached copy of this issue is now stale
+    get_issue.cache_evict(host, org, repo, issue_number)
+
     if result.returncode != 0:
         print(result.stderr, file=sys.stderr)
         raise GhError(result.returncode, result.stderr)
@@ -9,11 +9,12 @@ except ImportError:
     # Python < 3.8 fallback
     from importlib_metadata import version
 
+from . import HELP_URL  # noqa: F401 - re-exported for commands
 from .context import StoreContext
 from .gh_wrapper import GhError, list_issues
 
-# Help documentation URL
-HELP_URL = "https://github.com/Stabledog/notehub/blob/main/notehub-help.md"
+# Characters that make a note-ident a real regex rather than a plain substring
+_REGEX_META = frozenset(".[](){}*+?|^$\\")
 
 
 def get_version() -> str:
@@ -24,13 +25,17 @@ def get_version() -> str:
         return "unknown"
 
 
-def resolve_note_ident(context: StoreContext, ident: str) -> tuple[int | None, str | None]:
+def resolve_note_ident(
+    context: StoreContext, ident: str, all_issues: list[dict] | None = None
+) -> tuple[int | None, str | None]:
     """
     Resolve note-ident to issue number.
 
     Args:
         context: Store context (host/org/repo)
         ident: Issue number (e.g., "123") or title regex (e.g., "bug.*login")
+        all_issues: Pre-fetched issue list (number, title) to match against;
+                    fetched via list_issues() when None
 
     Returns:
         Tuple of (issue_number, error_message)
@@ -43,11 +48,16 @@ def resolve_note_ident(context: StoreContext, ident: str) -> tuple[int | None, s
     else:
         # Title regex - fetch only number and title for matching
         try:
-            all_issues = list_issues(context.host, context.org, context.repo, fields="number,title")
-
-            # Apply regex to titles (case-insensitive)
-            pattern = re.compile(ident, re.IGNORECASE)
-            matches = [issue for issue in all_issues if pattern.search(issue["title"])]
+            if all_issues is None:
+                all_issues = list_issues(context.host, context.org, context.repo, fields="number,title")
+
+            # Match titles case-insensitively; plain words skip the regex engine
+            if _REGEX_META.isdisjoint(ident):
+                needle = ident.lower()
+                matches = [issue for issue in all_issues if needle in issue["title"].lower()]
+            else:
+                pattern = re.compile(ident, re.IGNORECASE)
+                matches = [issue for issue in all_issues if pattern.search(issue["title"])]
 
             if len(matches) == 0:
                 return (None, f"No issues found matching '{ident}'")
@@ -1,10 +1,80 @@
 """Shared pytest fixtures for notehub tests."""
 
+import copy
 import json
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict
 
 import pytest
 
+from notehub import cli, gh_wrapper
+from notehub.context import NOTEHUB_CONFIG_PATTERN, StoreContext
+
+
+def _clear_lookup_caches():
+    StoreContext._read_git_config.cache_clear()
+    StoreContext._read_git_remote_url.cache_clear()
+    gh_wrapper._env_for_host.cache_clear()
+    gh_wrapper._auth_state.cache_clear()
+    gh_wrapper.get_issue.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_lookup_caches():
+    """Reset per-process git/gh lookup caches so each test sees its own mocks."""
+    _clear_lookup_caches()
+    yield
+    _clear_lookup_caches()
+
+
+@pytest.fixture(autouse=True)
+def assume_git_repo(mocker):
+    """Treat the working directory as a git repo; git calls themselves are mocked per test."""
+    return mocker.patch("notehub.context.find_git_dir", return_value=Path("/path/to/repo/.git"))
+
+
+@pytest.fixture(scope="session")
+def parser():
+    """Full notehub argument parser, built once; parse_args leaves it unchanged."""
+    return cli.create_parser()
+
+
+@pytest.fixture(scope="session")
+def store_context_template():
+    """
+    StoreContext stand-in built once per session; tests take copies via ``store_context``.
+
+    Commands only read host/org/repo from the context, so a plain namespace is enough.
+    """
+    return SimpleNamespace(host="github.com", org="testorg", repo="testrepo")
+
+
+@pytest.fixture
+def store_context(store_context_template):
+    """
+    Per-test copy of the session StoreContext template.
+
+    Assigning host/org/repo on the copy leaves the template untouched.
+    """
+    return copy.copy(store_context_template)
+
+
+@pytest.fixture
+def resolved_context(mocker):
+    """
+    Factory that makes StoreContext.resolve return a real context for the test.
+
+    Defaults match the session template; keyword arguments override host/org/repo.
+    """
+
+    def _resolve(**attrs):
+        context = StoreContext(**{"host": "github.com", "org": "testorg", "repo": "testrepo", **attrs})
+        mocker.patch.object(StoreContext, "resolve", return_value=context)
+        return context
+
+    return _resolve
+
 
 @pytest.fixture
 def mock_env(mocker):
@@ -144,18 +214,16 @@ def mock_git_commands(mocker):
                 result.stderr = "" if in_git_repo else "Not a git repository"
                 return result
 
-            # Mock git config
-            if "config" in cmd and "--get" in cmd:
+            # Mock git config --get-regexp ^notehub\. (bulk notehub settings)
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
                 result = mocker.Mock()
-                key = cmd[-1]
-                if git_config and key in git_config:
+                if git_config:
                     result.returncode = 0
-                    result.stdout = git_config[key]
-                    result.stderr = ""
+                    result.stdout = "".join(f"{key} {value}\n" for key, value in git_config.items())
                 else:
                     result.returncode = 1
                     result.stdout = ""
-                    result.stderr = ""
+                result.stderr = ""
                 return result
 
             # Default: command not found
@@ -141,3 +141,42 @@ class TestCacheDiscovery:
         assert len(result) == 1
         assert result[0][0] == "github.example.com"
         assert result[0][3] == 42
+
+    def test_find_all_cached_notes_ignores_stray_files(self, mocker, tmp_path):
+        """Should skip regular files at any level of the cache tree."""
+        cache_root = tmp_path / "cache"
+        cache_path = cache_root / "github.com" / "org" / "repo" / "7"
+        cache_path.mkdir(parents=True)
+        (cache_path / ".git").mkdir()
+        (cache_root / "README").write_text("x")
+        (cache_root / "github.com" / "org" / "notes.txt").write_text("x")
+        (cache_root / "github.com" / "org" / "repo" / "8").write_text("x")
+
+        mocker.patch("notehub.cache.get_cache_root", return_value=cache_root)
+
+        result = cache.find_all_cached_notes()
+
+        assert result == [("github.com", "org", "repo", 7, cache_path)]
+
+    def test_find_all_cached_notes_skips_unreadable_dirs(self, mocker, tmp_path):
+        """Should skip directories it can't list instead of aborting the walk."""
+        cache_root = tmp_path / "cache"
+        cache_path = cache_root / "github.com" / "org" / "repo" / "7"
+        cache_path.mkdir(parents=True)
+        (cache_path / ".git").mkdir()
+        locked = cache_root / "github.com" / "locked"
+        locked.mkdir()
+
+        real_scandir = cache.os.scandir
+
+        def scandir(path):
+            if Path(path) == locked:
+                raise PermissionError(13, "Permission denied", str(path))
+            return real_scandir(path)
+
+        mocker.patch("notehub.cache.os.scandir", side_effect=scandir)
+        mocker.patch("notehub.cache.get_cache_root", return_value=cache_root)
+
+        result = cache.find_all_cached_notes()
+
+        assert result == [("github.com", "org", "repo", 7, cache_path)]
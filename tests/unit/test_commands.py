@@ -1,536 +1,411 @@
 """Unit tests for notehub command modules."""
 
+import io
+import os
+import shutil
+import subprocess
+import tempfile
+import time
 from argparse import Namespace
+from collections import namedtuple
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import DEFAULT
 
-from notehub.commands import add, edit
+import pytest
+
+from notehub import cache
+from notehub.commands import add, edit, sync
+from notehub.context import StoreContext
 from notehub.gh_wrapper import GhError
 
+# Parsed arguments are read-only to the commands, so tests share these instances.
+_ARGS_42 = Namespace(note_ident="42")
+_ARGS_NONEXISTENT = Namespace(note_ident="nonexistent")
+_ARGS_ADD = Namespace()
+_ARGS_SYNC_CACHED = Namespace(cached=True, note_ident=None)
 
-class TestPrepareEditorCommand:
-    """Tests for _prepare_editor_command function."""
+# gh failures raised by more than one test; mock raises the shared instance as-is.
+_GH_ERR_API = GhError(1, "API error")
+_GH_ERR_404 = GhError(1, "Not Found: 404")
 
-    def test_regular_editor(self, mocker):
-        """Should return editor as single-item list."""
-        mocker.patch("shutil.which", return_value="/usr/bin/vim")
-        result = edit._prepare_editor_command("vim")
-        assert result == ["/usr/bin/vim"]
+# Dirty notes as find_dirty_cached_notes reports them; tests slice what they need.
+_DIRTY_NOTES_3 = [("github.com", "org", "repo", n, Path(f"/cache/{n}")) for n in (1, 2, 3)]
+_CROSS_REPO_NOTES = [
+    ("github.com", "org1", "repo1", 1, Path("/cache/1")),
+    ("github.com", "org1", "repo1", 2, Path("/cache/2")),
+    ("github.com", "org2", "repo2", 5, Path("/cache/5")),
+]
 
-    def test_vscode_without_flag(self, mocker):
-        """Should add --wait flag for VS Code."""
-        mocker.patch("shutil.which", return_value="/usr/local/bin/code")
-        result = edit._prepare_editor_command("code")
-        assert result == ["/usr/local/bin/code", "--wait"]
+# subprocess.run result; edit_in_temp_file only reads returncode.
+_FakeResult = namedtuple("_FakeResult", "returncode")
 
-    def test_vscode_exe_windows(self, mocker):
-        """Should detect code.exe on Windows."""
-        mocker.patch(
-            "shutil.which",
-            return_value="C:\\Program Files\\Microsoft VS Code\\bin\\code.exe",
-        )
-        result = edit._prepare_editor_command("code.exe")
-        assert result == [
-            "C:\\Program Files\\Microsoft VS Code\\bin\\code.exe",
-            "--wait",
-        ]
-
-    def test_vscode_cmd_windows(self, mocker):
-        """Should detect code.cmd on Windows."""
-        mocker.patch(
-            "shutil.which",
-            return_value="C:\\Program Files\\Microsoft VS Code\\bin\\code.cmd",
-        )
-        result = edit._prepare_editor_command("code.cmd")
-        assert result == [
-            "C:\\Program Files\\Microsoft VS Code\\bin\\code.cmd",
-            "--wait",
-        ]
 
-    def test_vscode_with_path(self, mocker):
+class _FakeTempFile:
+    """Just enough of NamedTemporaryFile for edit_in_temp_file: name, write() and the with-protocol."""
+
+    def __init__(self, name, write):
+        self.name = name
+        self.write = write
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+
+def patch_store_context(mocker, store_context):
+    """Make StoreContext.resolve return ``store_context`` for every command module."""
+    return mocker.patch.object(StoreContext, "resolve", return_value=store_context)
+
+
+class TestPrepareEditorCommand:
+    """Tests for _prepare_editor_command function."""
+
+    @pytest.fixture(autouse=True)
+    def which(self, mocker):
+        """shutil.which stub; each test sets the PATH lookup result via ``return_value``."""
+        return mocker.patch.object(shutil, "which")
+
+    @pytest.mark.parametrize(
+        "editor,which_return,expected",
+        [
+            # Regular editor resolves to a single-item list
+            ("vim", "/usr/bin/vim", ["/usr/bin/vim"]),
+            # VS Code gets --wait added
+            ("code", "/usr/local/bin/code", ["/usr/local/bin/code", "--wait"]),
+            (
+                "code.exe",
+                "C:\\Program Files\\Microsoft VS Code\\bin\\code.exe",
+                ["C:\\Program Files\\Microsoft VS Code\\bin\\code.exe", "--wait"],
+            ),
+            (
+                "code.cmd",
+                "C:\\Program Files\\Microsoft VS Code\\bin\\code.cmd",
+                ["C:\\Program Files\\Microsoft VS Code\\bin\\code.cmd", "--wait"],
+            ),
+            # No second --wait when a wait flag is already present
+            ("code --wait", "/usr/local/bin/code", ["/usr/local/bin/code", "--wait"]),
+            ("code -w", "/usr/local/bin/code", ["/usr/local/bin/code", "-w"]),
+            # Any basename containing 'code' is treated as VS Code
+            ("mycode", "/usr/bin/mycode", ["/usr/bin/mycode", "--wait"]),
+            # Not found in PATH
+            ("nonexistent", None, None),
+        ],
+        ids=["regular", "vscode", "vscode-exe", "vscode-cmd", "has-wait", "has-w", "code-substring", "not-found"],
+    )
+    def test_prepare_editor_command(self, which, editor, which_return, expected):
+        """Should resolve the editor via PATH and add --wait for VS Code."""
+        which.return_value = which_return
+        assert edit._prepare_editor_command(editor) == expected
+
+    def test_vscode_with_path(self, mocker, which):
         """Should detect code in full path (absolute paths are used as-is)."""
         # Mock which to handle the path lookup
-        mocker.patch("shutil.which", return_value="/usr/local/bin/code")
+        which.return_value = "/usr/local/bin/code"
         # Also mock isabs to treat this as absolute on Windows for testing
-        mocker.patch("os.path.isabs", return_value=True)
+        mocker.patch.object(os.path, "isabs", return_value=True)
         result = edit._prepare_editor_command("/usr/local/bin/code")
         assert result == ["/usr/local/bin/code", "--wait"]
 
-    def test_vscode_already_has_wait_flag(self, mocker):
-        """Should not add --wait if already present."""
-        mocker.patch("shutil.which", return_value="/usr/local/bin/code")
-        result = edit._prepare_editor_command("code --wait")
-        assert result == ["/usr/local/bin/code", "--wait"]
 
-    def test_vscode_already_has_w_flag(self, mocker):
-        """Should not add --wait if -w already present."""
-        mocker.patch("shutil.which", return_value="/usr/local/bin/code")
-        result = edit._prepare_editor_command("code -w")
-        assert result == ["/usr/local/bin/code", "-w"]
-
-    def test_editor_with_code_in_name_but_not_vscode(self, mocker):
-        """Should detect 'code' substring in basename."""
-        mocker.patch("shutil.which", return_value="/usr/bin/mycode")
-        result = edit._prepare_editor_command("mycode")
-        assert result == ["/usr/bin/mycode", "--wait"]
-
-    def test_editor_not_found(self, mocker):
-        """Should return None if editor is not found in PATH."""
-        mocker.patch("shutil.which", return_value=None)
-        result = edit._prepare_editor_command("nonexistent")
-        assert result is None
+@pytest.fixture
+def fake_tempfile(mocker):
+    """
+    In-memory stand-in for the temp file edit_in_temp_file creates, edits and removes.
 
+    Patches tempfile.NamedTemporaryFile, os.path.getmtime, os.unlink and the
+    module's open() so no disk I/O happens. Call ``fake.edit(text)`` from a
+    subprocess.run side effect to simulate the editor saving the file.
 
-class TestEditInTempFile:
-    """Tests for edit_in_temp_file function."""
+    Returns:
+        SimpleNamespace with ``name``, ``content``, ``mtime``, ``edit`` and the ``unlink`` mock
+    """
+    fake = SimpleNamespace(name="/tmp/notehub-test.md", content=None, mtime=100.0)
 
-    def test_file_modified(self, mocker, tmp_path):
-        """Should return modified content when file is changed."""
-        # Create a real temp file to test modification detection
-        test_file = tmp_path / "test.md"
+    def write(text):
+        fake.content = text
 
-        # Mock tempfile to return our test file
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
+    def save(text):
+        fake.content = text
+        fake.mtime += 1
 
-        # Make write actually write to the file
-        def mock_write(content):
-            test_file.write_text(content)
+    def read(path):
+        return io.StringIO(fake.content)
 
-        mock_temp.write = mock_write
+    mocker.patch.object(tempfile, "NamedTemporaryFile", return_value=_FakeTempFile(fake.name, write))
+    mocker.patch.object(edit.os.path, "getmtime", side_effect=lambda path: fake.mtime)
+    mocker.patch.object(edit, "open", create=True, side_effect=read)
+    fake.unlink = mocker.patch.object(os, "unlink")
+    fake.edit = save
+    return fake
 
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
 
-        # Mock os.path.getmtime in the edit module to simulate file modification
-        mtime_values = [100.0, 200.0]  # First call returns 100, second returns 200
-        mocker.patch("notehub.commands.edit.os.path.getmtime", side_effect=mtime_values)
+class TestEditInTempFile:
+    """Tests for edit_in_temp_file function."""
 
+    def test_file_modified(self, mocker, fake_tempfile):
+        """Should return modified content when file is changed."""
         # Mock _prepare_editor_command to return a valid command
-        mocker.patch("notehub.commands.edit._prepare_editor_command", return_value=["vim"])
+        mocker.patch.object(edit, "_prepare_editor_command", return_value=["vim"])
 
-        # Mock subprocess.run to modify the file
+        # Simulate the editor saving new content
         def mock_edit(*args, **kwargs):
-            # Simulate editor modifying the file
-            test_file.write_text("modified content")
-            result = mocker.Mock()
-            result.returncode = 0
-            return result
+            fake_tempfile.edit("modified content")
+            return _FakeResult(0)
 
-        mocker.patch("subprocess.run", side_effect=mock_edit)
+        mocker.patch.object(subprocess, "run", side_effect=mock_edit)
 
         result = edit.edit_in_temp_file("original content", "vim")
 
         assert result == "modified content"
 
-    def test_file_unmodified(self, mocker, tmp_path):
+    def test_file_unmodified(self, mocker, fake_tempfile):
         """Should return None when file is not changed."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("original content")
-
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
-
         # Mock subprocess.run without modifying file
-        mock_result = mocker.Mock()
-        mock_result.returncode = 0
-        mocker.patch("subprocess.run", return_value=mock_result)
+        mocker.patch.object(subprocess, "run", return_value=_FakeResult(0))
 
         result = edit.edit_in_temp_file("original content", "vim")
 
         assert result is None
 
-    def test_editor_not_found(self, mocker, tmp_path, capsys):
+    def test_editor_not_found(self, mocker, fake_tempfile, capsys):
         """Should handle editor not found error."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("content")
-
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
-
         # Mock subprocess to raise FileNotFoundError
-        mocker.patch("subprocess.run", side_effect=FileNotFoundError())
+        mocker.patch.object(subprocess, "run", side_effect=FileNotFoundError())
 
         result = edit.edit_in_temp_file("content", "nonexistent")
 
         assert result is None
-        captured = capsys.readouterr()
-        assert "not found" in captured.err
+        assert "not found" in capsys.readouterr().err
 
-    def test_editor_not_found_windows(self, mocker, tmp_path, capsys):
+    def test_editor_not_found_windows(self, mocker, fake_tempfile, capsys):
         """Should show Windows-specific message when editor not found."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("content")
-
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
-
-        mocker.patch("subprocess.run", side_effect=FileNotFoundError())
+        mocker.patch.object(subprocess, "run", side_effect=FileNotFoundError())
         # Patch sys.platform in the edit module where it's actually used
-        mocker.patch("notehub.commands.edit.sys.platform", "win32")
-        mocker.patch("shutil.which", return_value="vi.exe")
+        mocker.patch.object(edit.sys, "platform", "win32")
+        mocker.patch.object(shutil, "which", return_value="vi.exe")
 
         result = edit.edit_in_temp_file("content", "vi")
 
         assert result is None
-        captured = capsys.readouterr()
-        assert ".exe" in captured.err
+        assert ".exe" in capsys.readouterr().err
 
-    def test_editor_returns_error(self, mocker, tmp_path):
+    def test_editor_returns_error(self, mocker, fake_tempfile):
         """Should return None when editor exits with error."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("content")
-
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
-
-        mock_result = mocker.Mock()
-        mock_result.returncode = 1
-        mocker.patch("subprocess.run", return_value=mock_result)
+        mocker.patch.object(subprocess, "run", return_value=_FakeResult(1))
 
         result = edit.edit_in_temp_file("content", "vim")
 
         assert result is None
 
-    def test_temp_file_cleanup(self, mocker, tmp_path):
+    def test_temp_file_cleanup(self, mocker, fake_tempfile):
         """Should clean up temp file even on error."""
-        test_file = tmp_path / "test.md"
-        test_file.write_text("content")
-
-        mock_temp = mocker.Mock()
-        mock_temp.name = str(test_file)
-        mock_temp.__enter__ = mocker.Mock(return_value=mock_temp)
-        mock_temp.__exit__ = mocker.Mock()
-        mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp)
-
-        mocker.patch("subprocess.run", side_effect=FileNotFoundError())
-        mock_unlink = mocker.patch("os.unlink")
+        mocker.patch.object(subprocess, "run", side_effect=FileNotFoundError())
 
         edit.edit_in_temp_file("content", "vim")
 
-        mock_unlink.assert_called_once_with(str(test_file))
+        fake_tempfile.unlink.assert_called_once_with(fake_tempfile.name)
+
+
+@pytest.fixture
+def fake_cache_path(mocker):
+    """
+    In-memory stand-in for a note's cache directory.
+
+    edit.run only checks ``exists()`` and joins paths before handing them to
+    patched cache helpers, so no real directory is needed. ``exists()`` is
+    False by default; set ``exists.return_value = True`` for an existing cache.
+    """
+    path = mocker.MagicMock(spec=Path)
+    path.exists.return_value = False
+    path.__truediv__.return_value = mocker.MagicMock(spec=Path)
+    return path
+
+
+@pytest.fixture
+def edit_run_env(mocker, store_context, fake_cache_path):
+    """
+    Patch everything edit.run touches for a note that edits and syncs cleanly.
+
+    The cache does not exist yet, so edit.run initializes it from get_issue;
+    tests that want an existing cache set ``cache_path.exists.return_value = True``.
+    Tests override ``return_value``/``side_effect`` on the mock they care about.
+
+    Returns:
+        SimpleNamespace with ``cache_path`` and the mocks tests assert on or override
+    """
+    patch_store_context(mocker, store_context)
+    cache_path = fake_cache_path
+    synced = {"updated_at": "2025-01-01T00:00:00Z"}
+    mocks = mocker.patch.multiple(
+        edit,
+        resolve_note_ident=DEFAULT,
+        get_issue=DEFAULT,
+        _ensure_cache_current=DEFAULT,
+        get_editor=DEFAULT,
+        _prepare_editor_command=DEFAULT,
+        _launch_editor_blocking=DEFAULT,
+        update_issue=DEFAULT,
+        get_issue_metadata=DEFAULT,
+    )
+    mocks.update(
+        mocker.patch.multiple(
+            edit.cache,
+            get_cache_path=DEFAULT,
+            get_note_path=DEFAULT,
+            init_cache=DEFAULT,
+            set_last_known_updated_at=DEFAULT,
+            commit_if_dirty=DEFAULT,
+            get_note_content=DEFAULT,
+        )
+    )
+    return_values = {
+        "resolve_note_ident": (42, None),
+        "get_cache_path": cache_path,
+        "get_note_path": cache_path / "note.md",
+        "commit_if_dirty": False,
+        "get_note_content": "content",
+        "get_issue": {"body": "content", **synced},
+        "get_editor": "vim",
+        "_prepare_editor_command": ["vim"],
+        "_launch_editor_blocking": 0,
+        "get_issue_metadata": synced,
+    }
+    for name, value in return_values.items():
+        mocks[name].return_value = value
+    return SimpleNamespace(
+        cache_path=cache_path,
+        resolve=mocks["resolve_note_ident"],
+        get_cache_path=mocks["get_cache_path"],
+        init=mocks["init_cache"],
+        set_ts=mocks["set_last_known_updated_at"],
+        note_content=mocks["get_note_content"],
+        get_issue=mocks["get_issue"],
+        ensure=mocks["_ensure_cache_current"],
+        get_editor=mocks["get_editor"],
+        launch=mocks["_launch_editor_blocking"],
+        update=mocks["update_issue"],
+    )
 
 
 class TestEditRun:
     """Tests for edit run function."""
 
-    def test_successful_edit(self, mocker, tmp_path):
+    def test_successful_edit(self, edit_run_env):
         """Should launch editor on cached note successfully."""
-        # Mock context resolution
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        # Mock note ident resolution
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        # Mock cache operations
-        cache_path = tmp_path / "cache"
-        cache_path.mkdir()
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-        mocker.patch(
-            "notehub.commands.edit.cache.get_note_path",
-            return_value=cache_path / "note.md",
-        )
-        mock_ensure = mocker.patch("notehub.commands.edit._ensure_cache_current")
-
-        # Mock editor
-        mocker.patch("notehub.commands.edit.get_editor", return_value="vim")
-        mocker.patch("notehub.commands.edit._prepare_editor_command", return_value=["vim"])
-        mock_launch = mocker.patch("notehub.commands.edit._launch_editor_blocking", return_value=0)
-
-        # Mock auto-sync operations
-        mocker.patch("notehub.commands.edit.cache.commit_if_dirty", return_value=False)
-        mocker.patch("notehub.commands.edit.cache.get_note_content", return_value="content")
-        mocker.patch("notehub.commands.edit.update_issue")
-        mocker.patch(
-            "notehub.commands.edit.get_issue_metadata",
-            return_value={"updated_at": "2025-01-01T00:00:00Z"},
-        )
-        mock_set_ts = mocker.patch("notehub.commands.edit.cache.set_last_known_updated_at")
+        edit_run_env.cache_path.exists.return_value = True
 
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 0
-        mock_ensure.assert_called_once()
-        mock_launch.assert_called_once()
-        mock_set_ts.assert_called_once()
+        edit_run_env.ensure.assert_called_once()
+        edit_run_env.launch.assert_called_once()
+        edit_run_env.set_ts.assert_called_once()
 
-    def test_no_changes_made(self, mocker, tmp_path):
+    def test_no_changes_made(self, edit_run_env):
         """Should handle cache creation for new issue."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        # Mock cache doesn't exist
-        cache_path = tmp_path / "cache"
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-
-        # Mock get_issue for cache init
-        mock_issue = {"body": "content", "updated_at": "2025-01-01T00:00:00Z"}
-        mocker.patch("notehub.commands.edit.get_issue", return_value=mock_issue)
-
-        mock_init = mocker.patch("notehub.commands.edit.cache.init_cache")
-        mocker.patch("notehub.commands.edit.cache.set_last_known_updated_at")
-        mocker.patch(
-            "notehub.commands.edit.cache.get_note_path",
-            return_value=cache_path / "note.md",
-        )
-
-        mocker.patch("notehub.commands.edit.get_editor", return_value="vim")
-        mocker.patch("notehub.commands.edit._prepare_editor_command", return_value=["vim"])
-        mocker.patch("notehub.commands.edit._launch_editor_blocking", return_value=0)
-
-        # Mock auto-sync operations
-        mocker.patch("notehub.commands.edit.cache.commit_if_dirty", return_value=False)
-        mocker.patch("notehub.commands.edit.cache.get_note_content", return_value="content")
-        mocker.patch("notehub.commands.edit.update_issue")
-        mocker.patch(
-            "notehub.commands.edit.get_issue_metadata",
-            return_value={"updated_at": "2025-01-01T00:00:00Z"},
-        )
-        mock_set_ts2 = mocker.patch("notehub.commands.edit.cache.set_last_known_updated_at")
-
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 0
-        mock_init.assert_called_once()
+        edit_run_env.init.assert_called_once()
         # set_last_known_updated_at called twice: once during init, once after sync
-        assert mock_set_ts2.call_count == 2
+        assert edit_run_env.set_ts.call_count == 2
 
-    def test_empty_body_user_confirms(self, mocker, tmp_path):
+    def test_empty_body_user_confirms(self, edit_run_env):
         """Should handle empty body from GitHub."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        cache_path = tmp_path / "cache"
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-
         # Empty body from GitHub
-        mock_issue = {"body": "", "updated_at": "2025-01-01T00:00:00Z"}
-        mocker.patch("notehub.commands.edit.get_issue", return_value=mock_issue)
-
-        mock_init = mocker.patch("notehub.commands.edit.cache.init_cache")
-        mocker.patch("notehub.commands.edit.cache.set_last_known_updated_at")
-        mocker.patch(
-            "notehub.commands.edit.cache.get_note_path",
-            return_value=cache_path / "note.md",
-        )
+        edit_run_env.get_issue.return_value = {"body": "", "updated_at": "2025-01-01T00:00:00Z"}
+        edit_run_env.note_content.return_value = ""
 
-        mocker.patch("notehub.commands.edit.get_editor", return_value="vim")
-        mocker.patch("notehub.commands.edit._prepare_editor_command", return_value=["vim"])
-        mocker.patch("notehub.commands.edit._launch_editor_blocking", return_value=0)
-
-        # Mock auto-sync operations
-        mocker.patch("notehub.commands.edit.cache.commit_if_dirty", return_value=False)
-        mocker.patch("notehub.commands.edit.cache.get_note_content", return_value="")
-        mocker.patch("notehub.commands.edit.update_issue")
-        mocker.patch(
-            "notehub.commands.edit.get_issue_metadata",
-            return_value={"updated_at": "2025-01-01T00:00:00Z"},
-        )
-
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 0
-        mock_init.assert_called_once_with(cache_path, 42, "")
+        edit_run_env.init.assert_called_once_with(edit_run_env.cache_path, 42, "")
 
-    def test_empty_body_user_declines(self, mocker, tmp_path):
+    def test_empty_body_user_declines(self, edit_run_env):
         """Should handle None body from GitHub."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        cache_path = tmp_path / "cache"
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-
         # None body from GitHub
-        mock_issue = {"body": None, "updated_at": "2025-01-01T00:00:00Z"}
-        mocker.patch("notehub.commands.edit.get_issue", return_value=mock_issue)
-
-        mock_init = mocker.patch("notehub.commands.edit.cache.init_cache")
-        mocker.patch("notehub.commands.edit.cache.set_last_known_updated_at")
-        mocker.patch(
-            "notehub.commands.edit.cache.get_note_path",
-            return_value=cache_path / "note.md",
-        )
+        edit_run_env.get_issue.return_value = {"body": None, "updated_at": "2025-01-01T00:00:00Z"}
+        edit_run_env.note_content.return_value = ""
 
-        mocker.patch("notehub.commands.edit.get_editor", return_value="vim")
-        mocker.patch("notehub.commands.edit._prepare_editor_command", return_value=["vim"])
-        mocker.patch("notehub.commands.edit._launch_editor_blocking", return_value=0)
-
-        # Mock auto-sync operations
-        mocker.patch("notehub.commands.edit.cache.commit_if_dirty", return_value=False)
-        mocker.patch("notehub.commands.edit.cache.get_note_content", return_value="")
-        mocker.patch("notehub.commands.edit.update_issue")
-        mocker.patch(
-            "notehub.commands.edit.get_issue_metadata",
-            return_value={"updated_at": "2025-01-01T00:00:00Z"},
-        )
-
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 0
-        mock_init.assert_called_once_with(cache_path, 42, "")
+        edit_run_env.init.assert_called_once_with(edit_run_env.cache_path, 42, "")
 
-    def test_keyboard_interrupt_during_confirmation(self, mocker, capsys):
+    def test_keyboard_interrupt_during_confirmation(self, edit_run_env, capsys):
         """Should handle Ctrl+C gracefully."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
         # Raise KeyboardInterrupt during cache operations
-        mocker.patch(
-            "notehub.commands.edit.cache.get_cache_path",
-            side_effect=KeyboardInterrupt(),
-        )
+        edit_run_env.get_cache_path.side_effect = KeyboardInterrupt()
 
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 1
-        captured = capsys.readouterr()
-        assert "Cancelled" in captured.err
+        assert "Cancelled" in capsys.readouterr().err
 
-    def test_note_ident_resolution_failure(self, mocker, capsys):
+    def test_note_ident_resolution_failure(self, edit_run_env, capsys):
         """Should handle note ident resolution error."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
         # Return error from resolve_note_ident
-        mocker.patch(
-            "notehub.commands.edit.resolve_note_ident",
-            return_value=(None, "Note not found"),
-        )
+        edit_run_env.resolve.return_value = (None, "Note not found")
 
-        args = Namespace(note_ident="nonexistent")
-        result = edit.run(args)
+        result = edit.run(_ARGS_NONEXISTENT)
 
         assert result == 1
-        captured = capsys.readouterr()
-        assert "Note not found" in captured.err
+        assert "Note not found" in capsys.readouterr().err
 
-    def test_gh_error_during_fetch(self, mocker, tmp_path):
+    def test_gh_error_during_fetch(self, edit_run_env):
         """Should handle GhError during cache initialization."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        cache_path = tmp_path / "cache"
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-
-        # Mock get_issue to raise GhError
-        mocker.patch("notehub.commands.edit.get_issue", side_effect=GhError(1, "API error"))
+        edit_run_env.get_issue.side_effect = _GH_ERR_API
 
-        # Mock get_issue to raise GhError
-        mocker.patch("notehub.commands.edit.get_issue", side_effect=GhError(1, "API error"))
-
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 1
 
-    def test_gh_error_during_update(self, mocker, tmp_path):
+    def test_gh_error_during_update(self, edit_run_env):
         """Should handle GhError during cache sync."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
-
-        cache_path = tmp_path / "cache"
-        cache_path.mkdir()
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-
-        # Mock _ensure_cache_current to raise GhError
-        mocker.patch(
-            "notehub.commands.edit._ensure_cache_current",
-            side_effect=GhError(1, "Sync failed"),
-        )
+        edit_run_env.cache_path.exists.return_value = True
+        edit_run_env.ensure.side_effect = GhError(1, "Sync failed")
 
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
+        result = edit.run(_ARGS_42)
 
         assert result == 1
 
-    def test_keyboard_interrupt_during_edit(self, mocker, capsys, tmp_path):
+    def test_keyboard_interrupt_during_edit(self, edit_run_env, capsys):
         """Should handle Ctrl+C during editor preparation."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.edit.StoreContext.resolve", return_value=mock_context)
-        mocker.patch("notehub.commands.edit.resolve_note_ident", return_value=(42, None))
+        edit_run_env.cache_path.exists.return_value = True
+        edit_run_env.get_editor.side_effect = KeyboardInterrupt()
 
-        cache_path = tmp_path / "cache"
-        cache_path.mkdir()
-        mocker.patch("notehub.commands.edit.cache.get_cache_path", return_value=cache_path)
-        mocker.patch("notehub.commands.edit._ensure_cache_current")
+        result = edit.run(_ARGS_42)
 
-        # Mock get_editor to raise KeyboardInterrupt
-        mocker.patch("notehub.commands.edit.get_editor", side_effect=KeyboardInterrupt())
+        assert result == 1
+        assert "Cancelled" in capsys.readouterr().err
 
-        args = Namespace(note_ident="42")
-        result = edit.run(args)
 
-        assert result == 1
-        captured = capsys.readouterr()
-        assert "Cancelled" in captured.err
+@pytest.fixture
+def add_run_env(mocker, store_context):
+    """
+    Patch add.run's gh calls for a label check and issue creation that succeed.
+
+    Returns:
+        SimpleNamespace with the ``context`` in use and the ``ensure``/``create`` mocks
+    """
+    patch_store_context(mocker, store_context)
+    mocks = mocker.patch.multiple(add, ensure_label_exists=DEFAULT, create_issue=DEFAULT)
+    mocks["ensure_label_exists"].return_value = True
+    return SimpleNamespace(context=store_context, ensure=mocks["ensure_label_exists"], create=mocks["create_issue"])
 
 
 class TestAddRun:
     """Tests for add run function."""
 
-    def test_successful_add(self, mocker):
+    def test_successful_add(self, add_run_env):
         """Should create issue with notehub label successfully."""
-        # Mock context resolution
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.add.StoreContext.resolve", return_value=mock_context)
-
-        # Mock ensure_label_exists to succeed
-        mock_ensure = mocker.patch("notehub.commands.add.ensure_label_exists", return_value=True)
-
-        # Mock create_issue to succeed
-        mock_create = mocker.patch("notehub.commands.add.create_issue")
-
-        args = Namespace()
-        result = add.run(args)
+        result = add.run(_ARGS_ADD)
 
         assert result == 0
-        mock_ensure.assert_called_once_with(
+        add_run_env.ensure.assert_called_once_with(
             "github.com",
             "testorg",
             "testrepo",
@@ -538,66 +413,69 @@ class TestAddRun:
             "FFC107",
             "Issues created by notehub CLI",
         )
-        mock_create.assert_called_once_with("github.com", "testorg", "testrepo", interactive=True, labels=["notehub"])
-
-    def test_label_creation_failure(self, mocker, capsys):
-        """Should return error when label creation fails."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.add.StoreContext.resolve", return_value=mock_context)
-
-        # Mock ensure_label_exists to fail
-        mocker.patch("notehub.commands.add.ensure_label_exists", return_value=False)
+        add_run_env.create.assert_called_once_with(
+            "github.com", "testorg", "testrepo", interactive=True, labels=["notehub"]
+        )
 
-        # Mock create_issue - should not be called
-        mock_create = mocker.patch("notehub.commands.add.create_issue")
+    def test_label_creation_failure(self, add_run_env, capsys):
+        """Should return error without launching gh when label creation fails."""
+        add_run_env.ensure.return_value = False
 
-        args = Namespace()
-        result = add.run(args)
+        result = add.run(_ARGS_ADD)
 
         assert result == 1
-        mock_create.assert_not_called()
-        captured = capsys.readouterr()
-        assert "Could not create 'notehub' label" in captured.err
+        add_run_env.create.assert_not_called()
+        assert "Could not create 'notehub' label" in capsys.readouterr().err
 
-    def test_issue_creation_gh_error(self, mocker):
-        """Should handle GhError during issue creation."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.add.StoreContext.resolve", return_value=mock_context)
+    def test_label_check_precedes_issue_prompt(self, add_run_env, capsys):
+        """Should finish the label check before gh takes over the terminal."""
+        calls = []
+        add_run_env.ensure.side_effect = lambda *args: calls.append("ensure") or True
+        add_run_env.create.side_effect = lambda *args, **kwargs: calls.append("create")
 
-        mocker.patch("notehub.commands.add.ensure_label_exists", return_value=True)
+        result = add.run(_ARGS_ADD)
 
+        assert result == 0
+        assert calls == ["ensure", "create"]
+        assert capsys.readouterr().err == ""
+
+    def test_issue_creation_gh_error(self, add_run_env):
+        """Should handle GhError during issue creation."""
         # Mock create_issue to raise GhError
-        mocker.patch("notehub.commands.add.create_issue", side_effect=GhError(1, "API error"))
+        add_run_env.create.side_effect = _GH_ERR_API
 
-        args = Namespace()
-        result = add.run(args)
+        result = add.run(_ARGS_ADD)
 
         assert result == 1
 
-    def test_context_resolution_integration(self, mocker):
+    def test_context_resolution_integration(self, add_run_env):
         """Should pass resolved context to gh_wrapper functions."""
         # Test with enterprise host
-        mock_context = mocker.Mock()
-        mock_context.host = "github.example.com"
-        mock_context.org = "mycompany"
-        mock_context.repo = "myproject"
-        mocker.patch("notehub.commands.add.StoreContext.resolve", return_value=mock_context)
-
-        mock_ensure = mocker.patch("notehub.commands.add.ensure_label_exists", return_value=True)
-        mock_create = mocker.patch("notehub.commands.add.create_issue")
+        add_run_env.context.host = "github.example.com"
+        add_run_env.context.org = "mycompany"
+        add_run_env.context.repo = "myproject"
 
-        args = Namespace()
-        add.run(args)
+        add.run(_ARGS_ADD)
 
         # Verify enterprise host was used
-        assert mock_ensure.call_args[0][0] == "github.example.com"
-        assert mock_create.call_args[0][0] == "github.example.com"
+        assert add_run_env.ensure.call_args[0][0] == "github.example.com"
+        assert add_run_env.create.call_args[0][0] == "github.example.com"
+
+
+@pytest.fixture
+def sync_cached_env(mocker):
+    """
+    Patch the cache/metadata calls sync --cached makes for each dirty note.
+
+    Returns:
+        SimpleNamespace with the ``commit``/``content``/``set_ts``/``metadata`` mocks
+    """
+    return SimpleNamespace(
+        commit=mocker.patch.object(cache, "commit_if_dirty", return_value=True),
+        content=mocker.patch.object(cache, "get_note_content", return_value="test content"),
+        set_ts=mocker.patch.object(cache, "set_last_known_updated_at"),
+        metadata=mocker.patch.object(sync, "get_issue_metadata", return_value={"updated_at": "2024-01-01T00:00:00Z"}),
+    )
 
 
 class TestSyncCached:
@@ -605,170 +483,113 @@ class TestSyncCached:
 
     def test_sync_cached_no_dirty_notes(self, mocker):
         """Should display message when no dirty notes found."""
-        from notehub.commands import sync
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=[])
 
-        mocker.patch("notehub.cache.find_dirty_cached_notes", return_value=[])
-
-        args = Namespace(cached=True, note_ident=None)
-        result = sync.run(args)
+        result = sync.run(_ARGS_SYNC_CACHED)
 
         assert result == 0
 
-    def test_sync_cached_multiple_notes(self, mocker):
+    def test_sync_cached_multiple_notes(self, mocker, sync_cached_env):
         """Should sync all dirty notes across repos."""
-        from pathlib import Path
-
-        from notehub.commands import sync
-
-        # Mock dirty notes from different repos
-        dirty_notes = [
-            ("github.com", "org1", "repo1", 1, Path("/cache/1")),
-            ("github.com", "org1", "repo1", 2, Path("/cache/2")),
-            ("github.com", "org2", "repo2", 5, Path("/cache/5")),
-        ]
-        mocker.patch("notehub.cache.find_dirty_cached_notes", return_value=dirty_notes)
-        mocker.patch("notehub.cache.commit_if_dirty", return_value=True)
-        mocker.patch("notehub.cache.get_note_content", return_value="test content")
-        mock_update = mocker.patch("notehub.commands.sync.update_issue")
-        mocker.patch(
-            "notehub.commands.sync.get_issue_metadata",
-            return_value={"updated_at": "2024-01-01T00:00:00Z"},
-        )
-        mocker.patch("notehub.cache.set_last_known_updated_at")
+        # Dirty notes from different repos
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=_CROSS_REPO_NOTES)
+        mock_update = mocker.patch.object(sync, "update_issue")
 
-        args = Namespace(cached=True, note_ident=None)
-        result = sync.run(args)
+        result = sync.run(_ARGS_SYNC_CACHED)
 
         assert result == 0
         assert mock_update.call_count == 3
 
-    def test_sync_cached_handles_404(self, mocker, capsys):
+    def test_sync_cached_handles_404(self, mocker, sync_cached_env, capsys):
         """Should skip deleted issues with warning."""
-        from pathlib import Path
-
-        from notehub.commands import sync
-
-        dirty_notes = [
-            ("github.com", "org", "repo", 1, Path("/cache/1")),
-        ]
-        mocker.patch("notehub.cache.find_dirty_cached_notes", return_value=dirty_notes)
-        mocker.patch("notehub.cache.commit_if_dirty", return_value=True)
-        mocker.patch("notehub.cache.get_note_content", return_value="test content")
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=_DIRTY_NOTES_3[:1])
 
         # Mock 404 error
-        mocker.patch(
-            "notehub.commands.sync.update_issue",
-            side_effect=GhError(1, "Not Found: 404"),
-        )
+        mocker.patch.object(sync, "update_issue", side_effect=_GH_ERR_404)
 
-        args = Namespace(cached=True, note_ident=None)
-        result = sync.run(args)
+        result = sync.run(_ARGS_SYNC_CACHED)
 
         assert result == 0
         captured = capsys.readouterr()
         assert "Skipped - issue deleted on GitHub" in captured.out
 
-    def test_sync_cached_handles_other_errors(self, mocker, capsys):
+    def test_sync_cached_handles_other_errors(self, mocker, sync_cached_env, capsys):
         """Should continue on errors and report failures."""
-        from pathlib import Path
-
-        from notehub.commands import sync
-
-        dirty_notes = [
-            ("github.com", "org", "repo", 1, Path("/cache/1")),
-            ("github.com", "org", "repo", 2, Path("/cache/2")),
-        ]
-        mocker.patch("notehub.cache.find_dirty_cached_notes", return_value=dirty_notes)
-        mocker.patch("notehub.cache.commit_if_dirty", return_value=True)
-        mocker.patch("notehub.cache.get_note_content", return_value="test content")
-
-        # First fails, second succeeds
-        mock_update = mocker.patch("notehub.commands.sync.update_issue")
-        mock_update.side_effect = [
-            GhError(1, "Permission denied"),
-            None,  # Success
-        ]
-        mocker.patch(
-            "notehub.commands.sync.get_issue_metadata",
-            return_value={"updated_at": "2024-01-01T00:00:00Z"},
-        )
-        mocker.patch("notehub.cache.set_last_known_updated_at")
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=_DIRTY_NOTES_3[:2])
 
-        args = Namespace(cached=True, note_ident=None)
-        result = sync.run(args)
+        # First fails, second succeeds (keyed by issue: notes sync concurrently)
+        outcomes = {1: GhError(1, "Permission denied"), 2: None}
+
+        def fake_update(host, org, repo, issue_num, content):
+            if outcomes[issue_num]:
+                raise outcomes[issue_num]
+
+        mocker.patch.object(sync, "update_issue", side_effect=fake_update)
+
+        result = sync.run(_ARGS_SYNC_CACHED)
 
         assert result == 1  # Should return error code
         captured = capsys.readouterr()
         assert "Failed" in captured.err
         assert "Synced 1 note(s)" in captured.out
 
-    def test_sync_cached_mixed_results(self, mocker):
+    def test_sync_cached_mixed_results(self, mocker, sync_cached_env):
         """Should handle mix of success, 404, and other errors."""
-        from pathlib import Path
-
-        from notehub.commands import sync
-
-        dirty_notes = [
-            ("github.com", "org", "repo", 1, Path("/cache/1")),  # Success
-            ("github.com", "org", "repo", 2, Path("/cache/2")),  # 404
-            ("github.com", "org", "repo", 3, Path("/cache/3")),  # Error
-        ]
-        mocker.patch("notehub.cache.find_dirty_cached_notes", return_value=dirty_notes)
-        mocker.patch("notehub.cache.commit_if_dirty", return_value=True)
-        mocker.patch("notehub.cache.get_note_content", return_value="test content")
-
-        mock_update = mocker.patch("notehub.commands.sync.update_issue")
-        mock_update.side_effect = [
-            None,  # Success
-            GhError(1, "Not Found: 404"),
-            GhError(1, "API rate limit"),
-        ]
-        mocker.patch(
-            "notehub.commands.sync.get_issue_metadata",
-            return_value={"updated_at": "2024-01-01T00:00:00Z"},
-        )
-        mocker.patch("notehub.cache.set_last_known_updated_at")
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=list(_DIRTY_NOTES_3))
 
-        args = Namespace(cached=True, note_ident=None)
-        result = sync.run(args)
+        outcomes = {1: None, 2: _GH_ERR_404, 3: GhError(1, "API rate limit")}
+
+        def fake_update(host, org, repo, issue_num, content):
+            if outcomes[issue_num]:
+                raise outcomes[issue_num]
+
+        mocker.patch.object(sync, "update_issue", side_effect=fake_update)
+
+        result = sync.run(_ARGS_SYNC_CACHED)
 
         assert result == 1  # Should fail due to error
 
+    def test_sync_cached_reports_in_discovery_order(self, mocker, capsys):
+        """Should print per-note results in the order notes were found."""
+        dirty_notes = [_DIRTY_NOTES_3[2], _DIRTY_NOTES_3[0], _DIRTY_NOTES_3[1]]
+        mocker.patch.object(cache, "find_dirty_cached_notes", return_value=dirty_notes)
+        mocker.patch.object(cache, "commit_if_dirty", return_value=True)
+        mocker.patch.object(cache, "get_note_content", return_value="test content")
+        # Earlier notes finish last
+        mocker.patch.object(
+            sync,
+            "update_issue",
+            side_effect=lambda host, org, repo, issue_num, content: time.sleep(issue_num * 0.01),
+        )
+        mocker.patch.object(sync, "get_issue_metadata", return_value={})
+
+        result = sync.run(_ARGS_SYNC_CACHED)
+
+        assert result == 0
+        lines = [line for line in capsys.readouterr().out.splitlines() if "Synced" in line and "#" in line]
+        assert lines == ["  org/repo#3: Synced", "  org/repo#1: Synced", "  org/repo#2: Synced"]
+
     def test_sync_requires_note_ident_without_cached(self, mocker, capsys):
         """Should require note_ident when --cached is not used."""
-        from notehub.commands import sync
-
         args = Namespace(cached=False, note_ident=None)
         result = sync.run(args)
 
         assert result == 1
-        captured = capsys.readouterr()
-        assert "NOTE-IDENT is required" in captured.err
+        assert "NOTE-IDENT is required" in capsys.readouterr().err
 
     def test_sync_single_note_still_works(self, mocker):
         """Should still support single-note sync without --cached."""
-        from pathlib import Path
-
-        from notehub.commands import sync
-
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "org"
-        mock_context.repo = "repo"
-        mocker.patch("notehub.commands.sync.StoreContext.resolve", return_value=mock_context)
-        mocker.patch("notehub.commands.sync.resolve_note_ident", return_value=(1, None))
+        patch_store_context(mocker, SimpleNamespace(host="github.com", org="org", repo="repo"))
+        mocker.patch.object(sync, "resolve_note_ident", return_value=(1, None))
 
         cache_path = Path("/cache/1")
-        mocker.patch("notehub.cache.get_cache_path", return_value=cache_path)
-        mocker.patch("pathlib.Path.exists", return_value=True)
-        mocker.patch("notehub.cache.commit_if_dirty", return_value=False)
-        mocker.patch("notehub.cache.get_note_content", return_value="content")
-        mock_update = mocker.patch("notehub.commands.sync.update_issue")
-        mocker.patch(
-            "notehub.commands.sync.get_issue_metadata",
-            return_value={"updated_at": "2024-01-01T00:00:00Z"},
-        )
-        mocker.patch("notehub.cache.set_last_known_updated_at")
+        mocker.patch.object(cache, "get_cache_path", return_value=cache_path)
+        mocker.patch.object(Path, "exists", return_value=True)
+        mocker.patch.object(cache, "commit_if_dirty", return_value=False)
+        mocker.patch.object(cache, "get_note_content", return_value="content")
+        mock_update = mocker.patch.object(sync, "update_issue")
+        mocker.patch.object(sync, "get_issue_metadata", return_value={"updated_at": "2024-01-01T00:00:00Z"})
+        mocker.patch.object(cache, "set_last_known_updated_at")
 
         args = Namespace(cached=False, note_ident="1")
         result = sync.run(args)
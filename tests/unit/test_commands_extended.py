@@ -1,6 +1,5 @@
 """Unit tests for additional notehub command modules (show, list, status) and CLI."""
 
-import io
 from argparse import Namespace
 
 import pytest
@@ -14,19 +13,9 @@ from notehub.gh_wrapper import GhError
 class TestShowRun:
     """Tests for show run function."""
 
-    def test_show_single_issue_success(self, mocker, capsys):
+    def test_show_single_issue_success(self, mocker, resolved_context, capsys):
         """Should display single issue successfully."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-
-        mocker.patch("notehub.commands.show.resolve_note_ident", return_value=(42, None))
-
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.show.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.show.resolve_note_ident", return_value=(42, None))
 
@@ -46,13 +35,9 @@ class TestShowRun:
         assert "#42: Test Issue" in captured.out
         assert "https://github.com/testorg/testrepo/issues/42" in captured.out
 
-    def test_show_multiple_issues(self, mocker, capsys):
+    def test_show_multiple_issues(self, mocker, resolved_context, capsys):
         """Should display multiple issues with blank lines between."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.show.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         # Mock resolve_note_ident to return different issue numbers
         mocker.patch(
@@ -60,19 +45,20 @@ class TestShowRun:
             side_effect=[(42, None), (43, None)],
         )
 
-        mock_issues = [
-            {
+        mock_issues = {
+            42: {
                 "number": 42,
                 "title": "First",
                 "html_url": "https://github.com/testorg/testrepo/issues/42",
             },
-            {
+            43: {
                 "number": 43,
                 "title": "Second",
                 "html_url": "https://github.com/testorg/testrepo/issues/43",
             },
-        ]
-        mocker.patch("notehub.commands.show.get_issue", side_effect=mock_issues)
+        }
+        mock_batch = mocker.patch("notehub.commands.show.get_issues_batch", return_value=mock_issues)
+        mock_single = mocker.patch("notehub.commands.show.get_issue")
         mocker.patch(
             "notehub.commands.show.format_note_header",
             side_effect=["#42: First", "#43: Second"],
@@ -85,11 +71,12 @@ class TestShowRun:
         captured = capsys.readouterr()
         assert "#42: First" in captured.out
         assert "#43: Second" in captured.out
+        mock_batch.assert_called_once_with("github.com", "testorg", "testrepo", [42, 43])
+        mock_single.assert_not_called()
 
-    def test_show_partial_failure(self, mocker, capsys):
+    def test_show_partial_failure(self, mocker, resolved_context, capsys):
         """Should continue processing after error and return error code."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.show.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         # First succeeds, second fails, third succeeds
         mocker.patch(
@@ -97,16 +84,18 @@ class TestShowRun:
             side_effect=[(42, None), (None, "Not found"), (44, None)],
         )
 
-        mock_issues = [
-            {"number": 42, "title": "First", "html_url": "url1"},
-            {"number": 44, "title": "Third", "html_url": "url3"},
-        ]
-        mocker.patch("notehub.commands.show.get_issue", side_effect=mock_issues)
+        mock_issues = {
+            42: {"number": 42, "title": "First", "html_url": "url1"},
+            44: {"number": 44, "title": "Third", "html_url": "url3"},
+        }
+        mocker.patch("notehub.commands.show.get_issues_batch", return_value=mock_issues)
         mocker.patch(
             "notehub.commands.show.format_note_header",
             side_effect=["#42: First", "#44: Third"],
         )
 
+        mocker.patch("notehub.commands.show.list_issues", return_value=[])
+
         args = Namespace(note_idents=["42", "nonexistent", "44"])
         result = show.run(args)
 
@@ -114,10 +103,9 @@ class TestShowRun:
         captured = capsys.readouterr()
         assert "Error: Not found" in captured.err
 
-    def test_show_gh_error(self, mocker, capsys):
+    def test_show_gh_error(self, mocker, resolved_context, capsys):
         """Should handle GhError during issue fetch."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.show.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.show.resolve_note_ident", return_value=(42, None))
         mocker.patch("notehub.commands.show.get_issue", side_effect=GhError(1, "API error"))
@@ -129,16 +117,109 @@ class TestShowRun:
         captured = capsys.readouterr()
         assert "API error" in captured.err
 
-    def test_show_all_failures(self, mocker, capsys):
+    def test_show_batch_missing_issue(self, mocker, resolved_context, capsys):
+        """Should report numbers the batch fetch did not return."""
+        resolved_context()
+
+        mocker.patch(
+            "notehub.commands.show.resolve_note_ident",
+            side_effect=[(42, None), (999, None)],
+        )
+        mocker.patch(
+            "notehub.commands.show.get_issues_batch",
+            return_value={42: {"number": 42, "title": "First", "html_url": "url1"}},
+        )
+
+        args = Namespace(note_idents=["42", "999"])
+        result = show.run(args)
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "[#42] First" in captured.out
+        assert "issue #999 not found" in captured.err
+
+    def test_show_batch_failure_only_fails_affected_idents(self, mocker, resolved_context, capsys):
+        """Should fall back to per-issue fetches when the batch fails as a whole."""
+        resolved_context()
+
+        mocker.patch(
+            "notehub.commands.show.resolve_note_ident",
+            side_effect=[(42, None), (43, None)],
+        )
+        mocker.patch("notehub.commands.show.get_issues_batch", side_effect=GhError(1, "HTTP 502"))
+        issues = {42: {"number": 42, "title": "First", "html_url": "url42"}}
+
+        def fake_get_issue(host, org, repo, issue_num):
+            if issue_num not in issues:
+                raise GhError(1, "HTTP 403: Forbidden")
+            return issues[issue_num]
+
+        mocker.patch("notehub.commands.show.get_issue", side_effect=fake_get_issue)
+
+        args = Namespace(note_idents=["42", "43"])
+        result = show.run(args)
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "[#42] First" in captured.out
+        assert "Error processing '43': HTTP 403: Forbidden" in captured.err
+        assert "'42'" not in captured.err
+
+    def test_show_lists_issues_once_for_regex_idents(self, mocker, resolved_context, capsys):
+        """Should fetch the issue list once and share it across regex idents."""
+        resolved_context()
+
+        all_issues = [
+            {"number": 42, "title": "Login bug"},
+            {"number": 43, "title": "Feature request"},
+        ]
+        mock_list = mocker.patch("notehub.commands.show.list_issues", return_value=all_issues)
+        mocker.patch(
+            "notehub.commands.show.get_issues_batch",
+            return_value={
+                42: {"number": 42, "title": "Login bug", "html_url": "url42"},
+                43: {"number": 43, "title": "Feature request", "html_url": "url43"},
+            },
+        )
+
+        args = Namespace(note_idents=["login", "feature"])
+        result = show.run(args)
+
+        assert result == 0
+        mock_list.assert_called_once()
+        captured = capsys.readouterr()
+        assert "[#42] Login bug" in captured.out
+        assert "[#43] Feature request" in captured.out
+
+    def test_show_list_failure_reported_per_regex_ident(self, mocker, resolved_context, capsys):
+        """Should report a listing failure against each regex ident."""
+        resolved_context()
+
+        mocker.patch("notehub.commands.show.list_issues", side_effect=GhError(1, "HTTP 502"))
+        mocker.patch(
+            "notehub.commands.show.get_issue",
+            return_value={"number": 42, "title": "First", "html_url": "url42"},
+        )
+
+        args = Namespace(note_idents=["42", "login"])
+        result = show.run(args)
+
+        assert result == 1
+        captured = capsys.readouterr()
+        assert "[#42] First" in captured.out
+        assert "Failed to list issues: HTTP 502" in captured.err
+
+    def test_show_all_failures(self, mocker, resolved_context, capsys):
         """Should handle all idents failing."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.show.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch(
             "notehub.commands.show.resolve_note_ident",
             side_effect=[(None, "Not found"), (None, "No match")],
         )
 
+        mocker.patch("notehub.commands.show.list_issues", return_value=[])
+
         args = Namespace(note_idents=["bad1", "bad2"])
         result = show.run(args)
 
@@ -148,13 +229,9 @@ class TestShowRun:
 class TestListRun:
     """Tests for list run function."""
 
-    def test_list_success(self, mocker, capsys):
+    def test_list_success(self, mocker, resolved_context, capsys):
         """Should display all issues."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mocker.patch("notehub.commands.list.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mock_issues = [
             {"number": 42, "title": "First", "url": "url1"},
@@ -176,10 +253,9 @@ class TestListRun:
         assert "#43: Second" in captured.out
         assert "url2" in captured.out
 
-    def test_list_empty(self, mocker, capsys):
+    def test_list_empty(self, mocker, resolved_context, capsys):
         """Should handle empty issue list."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.list.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.list.list_issues", return_value=[])
 
@@ -190,10 +266,9 @@ class TestListRun:
         captured = capsys.readouterr()
         assert captured.out == ""
 
-    def test_list_gh_error(self, mocker):
+    def test_list_gh_error(self, mocker, resolved_context):
         """Should return error code on GhError."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.list.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.list.list_issues", side_effect=GhError(1, "API error"))
 
@@ -202,10 +277,9 @@ class TestListRun:
 
         assert result == 1
 
-    def test_list_formatting_consistency(self, mocker, capsys):
+    def test_list_formatting_consistency(self, mocker, resolved_context, capsys):
         """Should match show command formatting with blank lines."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.list.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mock_issues = [
             {"number": 1, "title": "A", "url": "u1"},
@@ -231,21 +305,15 @@ class TestListRun:
 class TestStatusRun:
     """Tests for status run function."""
 
-    def test_status_authenticated_with_env(self, mocker, capsys):
+    def test_status_authenticated_with_env(self, mocker, resolved_context, capsys):
         """Should display status when authenticated via appropriate environment token."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mock_context.full_identifier = mocker.Mock(return_value="testorg/testrepo")
-        mocker.patch("notehub.commands.status.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.status.get_local_repo_path", return_value="/path/to/repo")
         mocker.patch("notehub.commands.status.check_gh_installed", return_value=True)
         # Use GITHUB_TOKEN for github.com (enterprise token would be ignored)
         mocker.patch.dict("os.environ", {"GITHUB_TOKEN": "token"}, clear=True)
-        mocker.patch("notehub.commands.status.check_gh_auth", return_value=True)
-        mocker.patch("notehub.commands.status.get_gh_user", return_value="testuser")
+        mocker.patch("notehub.commands.status.get_auth_state", return_value=(True, "testuser"))
 
         args = Namespace()
         result = status.run(args)
@@ -260,21 +328,15 @@ class TestStatusRun:
         assert "Authenticated" in captured.out
         assert "testuser" in captured.out
 
-    def test_status_with_enterprise_token_for_github_com(self, mocker, capsys):
+    def test_status_with_enterprise_token_for_github_com(self, mocker, resolved_context, capsys):
         """Should use gh auth when enterprise tokens are set for github.com."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "testorg"
-        mock_context.repo = "testrepo"
-        mock_context.full_identifier = mocker.Mock(return_value="testorg/testrepo")
-        mocker.patch("notehub.commands.status.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.status.get_local_repo_path", return_value="/path/to/repo")
         mocker.patch("notehub.commands.status.check_gh_installed", return_value=True)
         # Enterprise token set but should be ignored for github.com
         mocker.patch.dict("os.environ", {"GH_ENTERPRISE_TOKEN_2": "token"}, clear=True)
-        mocker.patch("notehub.commands.status.check_gh_auth", return_value=True)
-        mocker.patch("notehub.commands.status.get_gh_user", return_value="testuser")
+        mocker.patch("notehub.commands.status.get_auth_state", return_value=(True, "testuser"))
 
         args = Namespace()
         result = status.run(args)
@@ -288,19 +350,14 @@ class TestStatusRun:
         assert "Authenticated" in captured.out
         assert "testuser" in captured.out
 
-    def test_status_not_authenticated(self, mocker, capsys):
+    def test_status_not_authenticated(self, mocker, resolved_context, capsys):
         """Should display setup instructions when not authenticated."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.example.com"
-        mock_context.org = "org"
-        mock_context.repo = "repo"
-        mock_context.full_identifier = mocker.Mock(return_value="github.example.com:org/repo")
-        mocker.patch("notehub.commands.status.StoreContext.resolve", return_value=mock_context)
+        resolved_context(host="github.example.com", org="org", repo="repo")
 
         mocker.patch("notehub.commands.status.get_local_repo_path", return_value=None)
         mocker.patch("notehub.commands.status.check_gh_installed", return_value=True)
         mocker.patch.dict("os.environ", {}, clear=True)
-        mocker.patch("notehub.commands.status.check_gh_auth", return_value=False)
+        mocker.patch("notehub.commands.status.get_auth_state", return_value=(False, None))
 
         args = Namespace()
         result = status.run(args)
@@ -311,10 +368,9 @@ class TestStatusRun:
         assert "gh auth login --hostname github.example.com" in captured.out
         assert "global context" in captured.out
 
-    def test_status_gh_not_installed(self, mocker, capsys):
+    def test_status_gh_not_installed(self, mocker, resolved_context, capsys):
         """Should show gh not installed message."""
-        mock_context = mocker.Mock()
-        mocker.patch("notehub.commands.status.StoreContext.resolve", return_value=mock_context)
+        resolved_context()
 
         mocker.patch("notehub.commands.status.get_local_repo_path", return_value=None)
         mocker.patch("notehub.commands.status.check_gh_installed", return_value=False)
@@ -327,95 +383,88 @@ class TestStatusRun:
         assert "gh CLI not found" in captured.out
         assert "https://cli.github.com/" in captured.out
 
-    def test_get_env_auth_source_priority(self, mocker):
+    @pytest.mark.parametrize(
+        "env,host,expected",
+        [
+            # github.com with GITHUB_TOKEN
+            ({"GITHUB_TOKEN": "token1", "GH_ENTERPRISE_TOKEN_2": "token2"}, "github.com", "GITHUB_TOKEN"),
+            # github.com with only GH_TOKEN (no enterprise tokens)
+            ({"GH_TOKEN": "token"}, "github.com", "GH_TOKEN"),
+            # github.com with enterprise tokens but no GITHUB_TOKEN - should use gh auth
+            ({"GH_ENTERPRISE_TOKEN_2": "enterprise-token"}, "github.com", None),
+            # github.com with GH_TOKEN and enterprise tokens - should use gh auth
+            ({"GH_TOKEN": "token", "GH_ENTERPRISE_TOKEN": "enterprise"}, "github.com", None),
+            # Enterprise hosts with enterprise tokens
+            (
+                {"GITHUB_TOKEN": "token1", "GH_ENTERPRISE_TOKEN_2": "token2"},
+                "enterprise.github.com",
+                "GH_ENTERPRISE_TOKEN_2",
+            ),
+            ({"GH_ENTERPRISE_TOKEN": "token"}, "enterprise.github.com", "GH_ENTERPRISE_TOKEN"),
+            # Enterprise host with only GH_TOKEN (no GITHUB_TOKEN)
+            ({"GH_TOKEN": "token"}, "enterprise.github.com", "GH_TOKEN"),
+            # Enterprise host with only GITHUB_TOKEN - should use gh auth
+            ({"GITHUB_TOKEN": "token"}, "enterprise.github.com", None),
+            # No token set, default host
+            ({}, None, None),
+        ],
+    )
+    def test_get_env_auth_source_priority(self, mock_env, env, host, expected):
         """Should return appropriate token env var based on host, or None to use gh auth."""
-        # For github.com with GITHUB_TOKEN
-        mocker.patch.dict(
-            "os.environ",
-            {"GITHUB_TOKEN": "token1", "GH_ENTERPRISE_TOKEN_2": "token2"},
-            clear=True,
-        )
-        assert status.get_env_auth_source("github.com") == "GITHUB_TOKEN"
+        mock_env(env)
 
-        # For github.com with only GH_TOKEN (no enterprise tokens)
-        mocker.patch.dict("os.environ", {"GH_TOKEN": "token"}, clear=True)
-        assert status.get_env_auth_source("github.com") == "GH_TOKEN"
+        result = status.get_env_auth_source() if host is None else status.get_env_auth_source(host)
 
-        # For github.com with enterprise tokens but no GITHUB_TOKEN - should use gh auth
-        mocker.patch.dict(
-            "os.environ",
-            {"GH_ENTERPRISE_TOKEN_2": "enterprise-token"},
-            clear=True,
-        )
-        assert status.get_env_auth_source("github.com") is None
+        assert result == expected
 
-        # For github.com with GH_TOKEN and enterprise tokens - should use gh auth
-        mocker.patch.dict(
-            "os.environ",
-            {"GH_TOKEN": "token", "GH_ENTERPRISE_TOKEN": "enterprise"},
-            clear=True,
-        )
-        assert status.get_env_auth_source("github.com") is None
+    def test_get_local_repo_path_in_repo(self, mocker, tmp_path, monkeypatch):
+        """Should return repo root when run from inside a git repo."""
+        mocker.patch.dict("os.environ", {}, clear=True)
+        (tmp_path / ".git").mkdir()
+        subdir = tmp_path / "src"
+        subdir.mkdir()
+        monkeypatch.chdir(subdir)
+        mock_run = mocker.patch("subprocess.run")
 
-        # For enterprise hosts with enterprise tokens
-        mocker.patch.dict(
-            "os.environ",
-            {"GITHUB_TOKEN": "token1", "GH_ENTERPRISE_TOKEN_2": "token2"},
-            clear=True,
-        )
-        assert status.get_env_auth_source("enterprise.github.com") == "GH_ENTERPRISE_TOKEN_2"
+        result = status.get_local_repo_path()
 
-        mocker.patch.dict("os.environ", {"GH_ENTERPRISE_TOKEN": "token"}, clear=True)
-        assert status.get_env_auth_source("enterprise.github.com") == "GH_ENTERPRISE_TOKEN"
+        assert result == str(tmp_path.resolve())
+        mock_run.assert_not_called()
 
-        # For enterprise host with only GH_TOKEN (no GITHUB_TOKEN)
-        mocker.patch.dict("os.environ", {"GH_TOKEN": "token"}, clear=True)
-        assert status.get_env_auth_source("enterprise.github.com") == "GH_TOKEN"
+    def test_get_local_repo_path_not_in_repo(self, mocker, tmp_path, monkeypatch):
+        """Should return None when not in git repo."""
+        mocker.patch.dict("os.environ", {}, clear=True)
+        monkeypatch.chdir(tmp_path)
 
-        # For enterprise host with only GITHUB_TOKEN - should use gh auth
-        mocker.patch.dict("os.environ", {"GITHUB_TOKEN": "token"}, clear=True)
-        assert status.get_env_auth_source("enterprise.github.com") is None
+        result = status.get_local_repo_path()
 
-        # No token set
-        mocker.patch.dict("os.environ", {}, clear=True)
-        assert status.get_env_auth_source() is None
+        assert result is None
 
-    def test_get_local_repo_path_in_repo(self, mocker):
-        """Should return repo path when in git repo."""
-        mock_result = mocker.Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "/home/user/project\n"
-        mocker.patch("subprocess.run", return_value=mock_result)
+    def test_get_local_repo_path_with_git_dir_env(self, mocker):
+        """Should ask git for the work tree when $GIT_DIR is set."""
+        mocker.patch.dict("os.environ", {"GIT_DIR": "../elsewhere.git"}, clear=True)
+        mock_run = mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0, stdout="/home/user/project\n"))
 
         result = status.get_local_repo_path()
 
         assert result == "/home/user/project"
+        assert mock_run.call_args[0][0] == ["git", "rev-parse", "--show-toplevel"]
 
-    def test_get_local_repo_path_not_in_repo(self, mocker):
-        """Should return None when not in git repo."""
-        mock_result = mocker.Mock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mocker.patch("subprocess.run", return_value=mock_result)
+    def test_get_local_repo_path_bare_git_dir(self, mocker):
+        """Should return None when $GIT_DIR points at a repo without a work tree."""
+        mocker.patch.dict("os.environ", {"GIT_DIR": "/srv/repo.git"}, clear=True)
+        mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=128, stdout=""))
 
-        result = status.get_local_repo_path()
-
-        assert result is None
+        assert status.get_local_repo_path() is None
 
-    def test_status_with_local_path(self, mocker, capsys):
+    def test_status_with_local_path(self, mocker, resolved_context, capsys):
         """Should display local repo path when available."""
-        mock_context = mocker.Mock()
-        mock_context.host = "github.com"
-        mock_context.org = "org"
-        mock_context.repo = "repo"
-        mock_context.full_identifier = mocker.Mock(return_value="org/repo")
-        mocker.patch("notehub.commands.status.StoreContext.resolve", return_value=mock_context)
+        resolved_context(org="org", repo="repo")
 
         mocker.patch("notehub.commands.status.get_local_repo_path", return_value="/local/path")
         mocker.patch("notehub.commands.status.check_gh_installed", return_value=True)
         mocker.patch.dict("os.environ", {}, clear=True)
-        mocker.patch("notehub.commands.status.check_gh_auth", return_value=True)
-        mocker.patch("notehub.commands.status.get_gh_user", return_value="user")
+        mocker.patch("notehub.commands.status.get_auth_state", return_value=(True, "user"))
 
         args = Namespace()
         status.run(args)
@@ -430,60 +479,38 @@ class TestCLI:
     def test_create_parser_has_all_commands(self):
         """Should create parser with all subcommands."""
         parser = cli.create_parser()
+        subparsers = next(a for a in parser._actions if a.dest == "command")
 
-        # Parse help to check subcommands exist
-        import contextlib
-
-        f = io.StringIO()
-        with contextlib.redirect_stdout(f):
-            try:
-                parser.parse_args(["--help"])
-            except SystemExit:
-                pass
-
-        help_text = f.getvalue()
-        assert "add" in help_text
-        assert "show" in help_text
-        assert "list" in help_text
-        assert "edit" in help_text
-        assert "status" in help_text
-        assert "sync" in help_text
-
-    def test_add_command_sets_handler(self):
+        assert {"add", "show", "list", "edit", "status", "sync"} <= set(subparsers.choices)
+
+    def test_add_command_sets_handler(self, parser):
         """Should set handler for add command."""
-        parser = cli.create_parser()
         args = parser.parse_args(["add"])
 
         assert hasattr(args, "handler")
-        assert args.handler == add.run
+        assert cli._load_handler(args.handler) is add.run
 
-    def test_show_command_requires_idents(self):
+    def test_show_command_requires_idents(self, parser):
         """Should require at least one note-ident for show."""
-        parser = cli.create_parser()
-
         with pytest.raises(SystemExit):
             parser.parse_args(["show"])
 
-    def test_show_command_accepts_multiple_idents(self):
+    def test_show_command_accepts_multiple_idents(self, parser):
         """Should accept multiple note-idents for show."""
-        parser = cli.create_parser()
         args = parser.parse_args(["show", "42", "43", "regex"])
 
         assert args.note_idents == ["42", "43", "regex"]
-        assert args.handler == show.run
+        assert cli._load_handler(args.handler) is show.run
 
-    def test_edit_command_requires_single_ident(self):
+    def test_edit_command_requires_single_ident(self, parser):
         """Should require exactly one note-ident for edit."""
-        parser = cli.create_parser()
         args = parser.parse_args(["edit", "42"])
 
         assert args.note_ident == "42"
-        assert args.handler == edit.run
+        assert cli._load_handler(args.handler) is edit.run
 
-    def test_common_args_on_all_commands(self):
+    def test_common_args_on_all_commands(self, parser):
         """Should accept common store args on all commands."""
-        parser = cli.create_parser()
-
         args = parser.parse_args(
             [
                 "add",
@@ -501,9 +528,8 @@ class TestCLI:
         assert args.repo == "myrepo"
         assert args.global_scope is True
 
-    def test_global_flag_short_form(self):
+    def test_global_flag_short_form(self, parser):
         """Should accept -g for --global."""
-        parser = cli.create_parser()
         args = parser.parse_args(["status", "-g"])
 
         assert args.global_scope is True
@@ -511,11 +537,13 @@ class TestCLI:
     def test_main_dispatches_to_handler(self, mocker):
         """Should parse args and call handler."""
         mock_handler = mocker.Mock(return_value=0)
+        mocker.patch("notehub.cli._fast_parse", return_value=None)
         mocker.patch("notehub.cli.create_parser")
 
+        mocker.patch("notehub.cli._load_handler", return_value=mock_handler)
+
         mock_parser = mocker.Mock()
         mock_parsed = mocker.Mock()
-        mock_parsed.handler = mock_handler
         mock_parser.parse_args = mocker.Mock(return_value=mock_parsed)
         cli.create_parser.return_value = mock_parser
 
@@ -527,14 +555,140 @@ class TestCLI:
     def test_main_returns_handler_exit_code(self, mocker):
         """Should return handler's exit code."""
         mock_handler = mocker.Mock(return_value=1)
+        mocker.patch("notehub.cli._fast_parse", return_value=None)
         mocker.patch("notehub.cli.create_parser")
 
+        mocker.patch("notehub.cli._load_handler", return_value=mock_handler)
+
         mock_parser = mocker.Mock()
         mock_parsed = mocker.Mock()
-        mock_parsed.handler = mock_handler
         mock_parser.parse_args = mocker.Mock(return_value=mock_parsed)
         cli.create_parser.return_value = mock_parser
 
         result = cli.main(["add"])
 
         assert result == 1
+
+    def test_create_parser_builds_only_requested_command(self):
+        """Should build just the named subparser when a command is given."""
+        parser = cli.create_parser("edit")
+        subparsers = next(a for a in parser._actions if a.dest == "command")
+
+        assert list(subparsers.choices) == ["edit"]
+        assert parser.parse_args(["edit", "42"]).handler == "notehub.commands.edit:run"
+
+    def test_create_parser_unknown_command_builds_all(self):
+        """Should fall back to building every subparser for unknown commands."""
+        parser = cli.create_parser("bogus")
+        subparsers = next(a for a in parser._actions if a.dest == "command")
+
+        assert set(subparsers.choices) == set(cli.SUBCOMMANDS)
+
+    def test_main_builds_parser_for_first_arg(self, mocker):
+        """Should pass the first argument to create_parser."""
+        mock_create = mocker.patch("notehub.cli.create_parser")
+        mocker.patch("notehub.cli._load_handler", return_value=mocker.Mock(return_value=0))
+
+        cli.main(["show", "42", "--host=gh.example.com"])
+
+        mock_create.assert_called_once_with("show")
+
+    def test_load_handler_imports_command_module(self):
+        """Should resolve a "module:function" handler reference."""
+        assert cli._load_handler("notehub.commands.status:run") is status.run
+
+    def test_cli_import_does_not_load_commands(self):
+        """Should not import command modules (or gh/git helpers) until dispatch."""
+        import subprocess
+        import sys
+
+        deferred = ("notehub.commands", "notehub.gh_wrapper", "notehub.context")
+        code = f"import sys, notehub.cli; print([m for m in sys.modules if m.startswith({deferred!r})])"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+
+        assert result.stdout.strip() == "[]"
+
+    @pytest.mark.parametrize("argv", [[], ["-h"], ["--help"]])
+    def test_main_top_level_help_skips_parser(self, mocker, capsys, argv):
+        """Should print static help without building a parser."""
+        mock_create = mocker.patch("notehub.cli.create_parser")
+
+        result = cli.main(argv)
+
+        assert result == 0
+        mock_create.assert_not_called()
+        out = capsys.readouterr().out
+        assert out.startswith("usage: notehub [-h] {add,show,status,edit,list,sync} ...")
+        assert cli.HELP_URL in out
+
+    def test_top_level_help_lists_subparser_help(self):
+        """Should list every subcommand with the same summary argparse would show."""
+        parser = cli.create_parser()
+        subparsers = next(a for a in parser._actions if a.dest == "command")
+        help_text = cli.format_top_level_help()
+
+        for choice in subparsers._choices_actions:
+            assert f"    {choice.dest:<20}{choice.help}" in help_text
+
+    @pytest.mark.parametrize("command", ["add", "status", "list", "sync"])
+    def test_store_args_shared_from_parent(self, command):
+        """Should give every subcommand the store args from the shared parent parser."""
+        parser = cli.create_parser(command)
+        args = parser.parse_args([command, "-H", "gh.example.com", "-o", "myorg", "-r", "myrepo", "-g"])
+
+        assert (args.host, args.org, args.repo, args.global_scope) == ("gh.example.com", "myorg", "myrepo", True)
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["add"],
+            ["status", "-g"],
+            ["list", "--host", "gh.example.com", "-o", "myorg", "-r", "myrepo"],
+            ["show", "42"],
+            ["show", "42", "bug.*login", "-H", "gh.example.com"],
+            ["show", "-g", "42", "43"],
+            ["edit", "42", "--org", "myorg"],
+            ["sync"],
+            ["sync", "-c"],
+            ["sync", "--repo", ".", "42", "--cached"],
+        ],
+    )
+    def test_fast_parse_matches_argparse(self, argv):
+        """Should produce the same Namespace as argparse for common shapes."""
+        expected = cli.create_parser(argv[0]).parse_args(argv)
+
+        assert cli._fast_parse(argv) == expected
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            ["bogus"],
+            ["add", "-h"],
+            ["add", "extra"],
+            ["show"],
+            ["show", "42", "-g", "43"],
+            ["edit"],
+            ["edit", "42", "43"],
+            ["sync", "41", "42"],
+            ["list", "--host"],
+            ["list", "--host", "-g"],
+            ["list", "--host=gh.example.com"],
+            ["status", "-gH", "gh.example.com"],
+            ["add", "--cached"],
+        ],
+    )
+    def test_fast_parse_defers_to_argparse(self, argv):
+        """Should return None for anything outside the common shapes."""
+        assert cli._fast_parse(argv) is None
+
+    def test_main_uses_fast_parse(self, mocker):
+        """Should dispatch without building a parser for common shapes."""
+        mock_create = mocker.patch("notehub.cli.create_parser")
+        mock_handler = mocker.Mock(return_value=0)
+        mocker.patch("notehub.cli._load_handler", return_value=mock_handler)
+
+        result = cli.main(["show", "42"])
+
+        assert result == 0
+        mock_create.assert_not_called()
+        assert mock_handler.call_args[0][0].note_idents == ["42"]
@@ -1,10 +1,12 @@
 """Unit tests for notehub.context module."""
 
+import concurrent.futures
 from argparse import Namespace
+from pathlib import Path
 
 import pytest
 
-from notehub.context import StoreContext
+from notehub.context import NOTEHUB_CONFIG_PATTERN, StoreContext, find_git_dir
 
 
 class TestStoreContextInit:
@@ -380,6 +382,29 @@ class TestGitRemoteParsing:
         assert context.repo == expected_repo
 
 
+class TestParseRemoteUrl:
+    """Tests for _parse_remote_url."""
+
+    @pytest.mark.parametrize(
+        "url,expected",
+        [
+            ("https://github.com/org/repo.git", ("github.com", "org", "repo")),
+            ("https://github.com/org/repo", ("github.com", "org", "repo")),
+            ("https://user@ghes.example.com:8443/org/repo.git", ("ghes.example.com", "org", "repo")),
+            ("ssh://git@github.com/org/repo.git", ("github.com", "org", "repo")),
+            ("git@github.com:org/repo.git", ("github.com", "org", "repo")),
+            ("git@github.com", ("github.com", None, None)),
+            ("ghenterprise:org/repo.git", (None, "org", "repo")),
+            ("https://github.com/", ("github.com", None, None)),
+            ("file:///srv/git/repo.git", (None, None, None)),
+            ("/srv/git/repo.git", (None, None, None)),
+        ],
+    )
+    def test_parse_remote_url(self, url, expected):
+        """Should split host, org and repo from each URL form."""
+        assert StoreContext._parse_remote_url(url) == expected
+
+
 class TestExpandGitUrl:
     """Tests for _expand_git_url method."""
 
@@ -550,16 +575,8 @@ class TestGlobalFlag:
             result.returncode = 0
 
             # Only respond to --global config requests
-            if "config" in cmd and "--global" in cmd:
-                if "notehub.host" in cmd:
-                    result.stdout = "enterprise.github.com"
-                elif "notehub.org" in cmd:
-                    result.stdout = "globalorg"
-                elif "notehub.repo" in cmd:
-                    result.stdout = "globalrepo"
-                else:
-                    result.returncode = 1
-                    result.stdout = ""
+            if "config" in cmd and "--global" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
+                result.stdout = "notehub.host enterprise.github.com\nnotehub.org globalorg\nnotehub.repo globalrepo\n"
             else:
                 result.returncode = 1
                 result.stdout = ""
@@ -584,20 +601,13 @@ class TestGlobalFlag:
             result.returncode = 0
 
             # Simulate both local and global configs being set
-            if "config" in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
                 if "--global" in cmd:
                     # Global config values
-                    if "notehub.repo" in cmd:
-                        result.stdout = "globalrepo"
-                    else:
-                        result.returncode = 1
-                        result.stdout = ""
-                elif "notehub.repo" in cmd:
-                    # Local config value (checked first for repo)
-                    result.stdout = "localrepo"
+                    result.stdout = "notehub.repo globalrepo\n"
                 else:
-                    result.returncode = 1
-                    result.stdout = ""
+                    # Local config value (checked first for repo)
+                    result.stdout = "notehub.repo localrepo\n"
             elif "remote" in cmd:
                 result.returncode = 1
                 result.stdout = ""
@@ -859,3 +869,161 @@ class TestTrackingRemote:
         # Should fall back to 'origin' remote
         assert context.org == "default-org"
         assert context.repo == "default-repo"
+
+
+class TestLookupCaching:
+    """Tests for per-process caching of git lookups."""
+
+    def test_remote_url_fetched_once_per_resolve(self, mocker, mock_git_commands):
+        """Should run `git remote get-url` once for host, org and repo detection."""
+        args = Namespace(host=None, org=None, repo=None)
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_run = mock_git_commands(url="https://github.example.com/myorg/myrepo.git")
+
+        context = StoreContext.resolve(args)
+
+        assert (context.host, context.org, context.repo) == ("github.example.com", "myorg", "myrepo")
+        get_url_calls = [c for c in mock_run.call_args_list if "get-url" in c.args[0]]
+        assert len(get_url_calls) == 1
+
+    def test_git_config_loaded_once_per_scope(self, mocker):
+        """Should read all notehub.* keys with one git call per scope."""
+        mock_result = mocker.Mock(returncode=0, stdout="notehub.org value\nnotehub.host gh.example.com\n")
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        assert StoreContext._get_git_config("notehub.org") == "value"
+        assert StoreContext._get_git_config("notehub.host") == "gh.example.com"
+        assert StoreContext._get_git_config("notehub.repo") is None
+        assert StoreContext._get_git_config("notehub.org", global_only=True) == "value"
+
+        assert mock_run.call_count == 2
+        assert mock_run.call_args_list[1].args[0] == ["git", "config", "--global", "--get-regexp", r"^notehub\."]
+
+    def test_git_config_keys_case_insensitive(self, mocker):
+        """Should match keys case-insensitively, as git does."""
+        mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0, stdout="notehub.host a b\n"))
+
+        assert StoreContext._get_git_config("notehub.Host") == "a b"
+
+    def test_prefetch_warms_caches_without_duplicate_calls(self, mocker, mock_git_commands):
+        """Should issue each git lookup once even though they start concurrently."""
+        args = Namespace(host=None, org=None, repo=".")
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_run = mock_git_commands(url="https://github.com/myorg/myrepo.git")
+        mock_pool = mocker.spy(concurrent.futures, "ThreadPoolExecutor")
+
+        StoreContext.resolve(args)
+
+        commands = [tuple(c.args[0]) for c in mock_run.call_args_list]
+        assert len(commands) == len(set(commands))
+        assert ("git", "config", "--get-regexp", NOTEHUB_CONFIG_PATTERN) in commands
+        mock_pool.assert_called_once()
+
+    def test_prefetch_skipped_when_lookups_share_first_step(self, mocker, mock_git_commands):
+        """Should not start a pool or read global config when the remote answers in a repo."""
+        args = Namespace(host=None, org=None, repo=None)
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_run = mock_git_commands(url="https://github.com/myorg/myrepo.git")
+        mock_pool = mocker.patch("concurrent.futures.ThreadPoolExecutor")
+
+        context = StoreContext.resolve(args)
+
+        assert (context.org, context.repo) == ("myorg", "myrepo")
+        mock_pool.assert_not_called()
+        commands = [tuple(c.args[0]) for c in mock_run.call_args_list]
+        assert ("git", "config", "--global", "--get-regexp", NOTEHUB_CONFIG_PATTERN) not in commands
+
+    def test_prefetch_skipped_when_flags_and_env_cover_everything(self, mocker):
+        """Should not start a thread pool when nothing needs git."""
+        args = Namespace(host=None, org="myorg", repo="myrepo")
+        mocker.patch.dict("os.environ", {"GH_HOST": "ghes.example.com"}, clear=True)
+        mock_pool = mocker.patch("concurrent.futures.ThreadPoolExecutor")
+
+        StoreContext.resolve(args)
+
+        mock_pool.assert_not_called()
+
+    def test_all_flags_skip_lookups(self, mocker):
+        """Should build the context from flags alone without any subprocess or env reads."""
+        args = Namespace(host="gh.example.com", org="myorg", repo="myrepo")
+        mock_run = mocker.patch("subprocess.run")
+        mock_environ_get = mocker.patch("os.environ.get")
+
+        context = StoreContext.resolve(args)
+
+        assert (context.host, context.org, context.repo) == ("gh.example.com", "myorg", "myrepo")
+        mock_run.assert_not_called()
+        mock_environ_get.assert_not_called()
+
+    def test_repo_dot_still_auto_detects(self, mocker, mock_git_commands):
+        """Should still run detection when --repo . accompanies the other flags."""
+        args = Namespace(host="github.com", org="myorg", repo=".")
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_git_commands(url="https://github.com/myorg/detected.git")
+
+        context = StoreContext.resolve(args)
+
+        assert context.repo == "detected"
+
+    def test_git_lookups_cached_per_repository(self, mocker, assume_git_repo):
+        """Should not reuse one repository's remote URL or local config in another."""
+        mock_run = mocker.patch(
+            "subprocess.run",
+            side_effect=lambda cmd, **kwargs: mocker.Mock(returncode=0, stdout=f"{assume_git_repo.return_value}\n"),
+        )
+
+        first = (StoreContext._get_git_remote_url(), dict(StoreContext._load_git_config()))
+        assume_git_repo.return_value = Path("/path/to/other/.git")
+        second = (StoreContext._get_git_remote_url(), dict(StoreContext._load_git_config()))
+
+        assert first != second
+        calls = mock_run.call_count
+        StoreContext._get_git_remote_url()
+        StoreContext._load_git_config()
+        assert mock_run.call_count == calls
+
+    def test_git_config_mapping_is_read_only(self, mocker):
+        """Should not let one caller change the cached config seen by the next."""
+        mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=0, stdout="notehub.org value\n"))
+
+        with pytest.raises(TypeError):
+            StoreContext._load_git_config()["notehub.org"] = "changed"
+
+
+class TestFindGitDir:
+    """Tests for find_git_dir (real filesystem walk, not the autouse stub)."""
+
+    def test_finds_git_dir_in_parent(self, mocker, tmp_path):
+        """Should walk up from a subdirectory to the enclosing .git."""
+        mocker.patch.dict("os.environ", {}, clear=True)
+        (tmp_path / ".git").mkdir()
+        subdir = tmp_path / "a" / "b"
+        subdir.mkdir(parents=True)
+
+        assert find_git_dir(subdir) == (tmp_path / ".git").resolve()
+
+    def test_accepts_gitfile(self, mocker, tmp_path):
+        """Should treat a .git file (worktree/submodule) as a repo."""
+        mocker.patch.dict("os.environ", {}, clear=True)
+        (tmp_path / ".git").write_text("gitdir: /elsewhere\n")
+
+        assert find_git_dir(tmp_path) == (tmp_path / ".git").resolve()
+
+    def test_honors_git_dir_env(self, mocker, tmp_path):
+        """Should return $GIT_DIR without walking."""
+        mocker.patch.dict("os.environ", {"GIT_DIR": "/custom/git"}, clear=True)
+
+        assert find_git_dir(tmp_path) == Path("/custom/git")
+
+    def test_skips_local_git_lookups_outside_repo(self, mocker, assume_git_repo):
+        """Should go straight to global config when not inside a repository."""
+        assume_git_repo.return_value = None
+        args = Namespace(host=None, org=None, repo=None)
+        mocker.patch.dict("os.environ", {}, clear=True)
+        mock_run = mocker.patch("subprocess.run", return_value=mocker.Mock(returncode=1, stdout=""))
+
+        context = StoreContext.resolve(args)
+
+        assert context.host == "github.com"
+        for call in mock_run.call_args_list:
+            assert call.args[0][:3] == ["git", "config", "--global"]
@@ -4,7 +4,7 @@ from argparse import Namespace
 
 import pytest
 
-from notehub.context import StoreContext
+from notehub.context import NOTEHUB_CONFIG_PATTERN, StoreContext
 
 
 class TestHostResolutionPriority:
@@ -17,10 +17,10 @@ class TestHostResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.host" in cmd and "--global" not in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd and "--global" not in cmd:
                 # Local git config returns custom host
                 result.returncode = 0
-                result.stdout = "local.github.com"
+                result.stdout = "notehub.host local.github.com\n"
             elif "rev-parse" in cmd and "HEAD" in cmd:
                 result.returncode = 0
                 result.stdout = "main"
@@ -49,11 +49,11 @@ class TestHostResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.host" in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
                 if "--global" in cmd:
                     # Global git config returns fallback host
                     result.returncode = 0
-                    result.stdout = "global.github.com"
+                    result.stdout = "notehub.host global.github.com\n"
                 else:
                     # Local git config not set
                     result.returncode = 1
@@ -90,10 +90,10 @@ class TestOrgResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.org" in cmd and "--global" not in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd and "--global" not in cmd:
                 # Local git config returns custom org
                 result.returncode = 0
-                result.stdout = "localorg"
+                result.stdout = "notehub.org localorg\n"
             elif "rev-parse" in cmd and "HEAD" in cmd:
                 result.returncode = 0
                 result.stdout = "main"
@@ -150,11 +150,11 @@ class TestOrgResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.org" in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
                 if "--global" in cmd:
                     # Global git config returns fallback org
                     result.returncode = 0
-                    result.stdout = "globalorg"
+                    result.stdout = "notehub.org globalorg\n"
                 else:
                     # Local git config not set
                     result.returncode = 1
@@ -191,10 +191,10 @@ class TestRepoResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.repo" in cmd and "--global" not in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd and "--global" not in cmd:
                 # Local git config returns custom repo
                 result.returncode = 0
-                result.stdout = "localrepo"
+                result.stdout = "notehub.repo localrepo\n"
             elif "rev-parse" in cmd and "HEAD" in cmd:
                 result.returncode = 0
                 result.stdout = "main"
@@ -251,11 +251,11 @@ class TestRepoResolutionPriority:
 
         def mock_git_call(cmd, **kwargs):
             result = mocker.Mock()
-            if "config" in cmd and "notehub.repo" in cmd:
+            if "config" in cmd and NOTEHUB_CONFIG_PATTERN in cmd:
                 if "--global" in cmd:
                     # Global git config returns fallback repo
                     result.returncode = 0
-                    result.stdout = "globalrepo"
+                    result.stdout = "notehub.repo globalrepo\n"
                 else:
                     # Local git config not set
                     result.returncode = 1
@@ -6,14 +6,19 @@ import pytest
 
 from notehub.gh_wrapper import (
     GhError,
+    _map_concurrently,
     _prepare_gh_cmd,
     _run_gh_command,
+    _ttl_cache,
     build_repo_arg,
     check_gh_auth,
     check_gh_installed,
+    get_auth_state,
     get_gh_user,
     get_issue,
+    get_issues_batch,
     list_issues,
+    update_issue,
 )
 
 
@@ -76,6 +81,29 @@ class TestPrepareGhCmd:
         assert env["GH_HOST"] == "github.enterprise.com"
         assert cmd == ["ghe.sh", "api", "user"]
 
+    def test_env_built_once_per_host(self, mocker):
+        """Should reuse the environment for a host instead of copying os.environ per call."""
+        mocker.patch.dict("os.environ", {}, clear=True)
+
+        _, env1 = _prepare_gh_cmd("github.com", ["gh", "api", "user"])
+        _, env2 = _prepare_gh_cmd("github.com", ["gh", "issue", "list"])
+        _, env3 = _prepare_gh_cmd("github.enterprise.com", ["gh", "api", "user"])
+
+        assert env1 is env2
+        assert env3["GH_HOST"] == "github.enterprise.com"
+        assert env1["GH_HOST"] == "github.com"
+
+    def test_env_rebuilt_when_token_changes(self, mocker):
+        """Should not reuse a cached environment after a token variable changes."""
+        mocker.patch.dict("os.environ", {"GH_TOKEN": "old"}, clear=True)
+        _, env1 = _prepare_gh_cmd("github.com", ["gh", "api", "user"])
+
+        mocker.patch.dict("os.environ", {"GH_TOKEN": "new"})
+        _, env2 = _prepare_gh_cmd("github.com", ["gh", "api", "user"])
+
+        assert env1["GH_TOKEN"] == "old"
+        assert env2["GH_TOKEN"] == "new"
+
 
 class TestBuildRepoArg:
     """Tests for build_repo_arg function."""
@@ -107,8 +135,8 @@ class TestGetIssue:
 
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps(mock_issue)
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps(mock_issue).encode()
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = get_issue("github.com", "testorg", "testrepo", 42)
@@ -121,8 +149,8 @@ class TestGetIssue:
         """Should raise GhError when issue not found."""
         mock_result = mocker.Mock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Not found"
+        mock_result.stdout = b""
+        mock_result.stderr = b"Not found"
         mocker.patch("subprocess.run", return_value=mock_result)
 
         with pytest.raises(GhError) as exc_info:
@@ -131,6 +159,296 @@ class TestGetIssue:
         assert exc_info.value.returncode == 1
         assert "Not found" in exc_info.value.stderr
 
+    def test_get_issue_cached_until_update(self, mocker):
+        """Should reuse the fetched issue until update_issue runs."""
+        payload = json.dumps({"number": 42, "title": "T", "html_url": "u", "body": "b"}).encode()
+        mock_run = mocker.patch(
+            "subprocess.run",
+            side_effect=lambda *args, **kwargs: mocker.Mock(returncode=0, stdout=payload, stderr=b""),
+        )
+
+        get_issue("github.com", "testorg", "testrepo", 42)
+        get_issue("github.com", "testorg", "testrepo", 42)
+        assert mock_run.call_count == 1
+
+        update_issue("github.com", "testorg", "testrepo", 42, "new body")
+        get_issue("github.com", "testorg", "testrepo", 42)
+        assert mock_run.call_count == 3
+
+    def test_get_issue_custom_fields(self, mocker):
+        """Should trim the response to the requested fields with --jq."""
+        mock_result = mocker.Mock(returncode=0, stdout=b'{"number": 42, "updated_at": "2024-01-01T00:00:00Z"}')
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        result = get_issue("github.com", "testorg", "testrepo", 42, fields=("number", "updated_at"))
+
+        assert result["updated_at"] == "2024-01-01T00:00:00Z"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--jq") + 1] == "{number: .number, updated_at: .updated_at}"
+
+    def test_update_evicts_custom_field_entries(self, mocker):
+        """Should drop cached results for every field set of the updated issue."""
+        payload = b'{"number": 42, "updated_at": "t"}'
+        mock_run = mocker.patch(
+            "subprocess.run",
+            side_effect=lambda *args, **kwargs: mocker.Mock(returncode=0, stdout=payload, stderr=b""),
+        )
+
+        get_issue("github.com", "testorg", "testrepo", 42, fields=("number", "updated_at"))
+        update_issue("github.com", "testorg", "testrepo", 42, "new body")
+        get_issue("github.com", "testorg", "testrepo", 42, fields=("number", "updated_at"))
+
+        assert mock_run.call_count == 3
+
+
+class TestGetIssuesBatch:
+    """Tests for get_issues_batch function."""
+
+    @staticmethod
+    def _graphql_response(mocker, repository, returncode=0, errors=None):
+        payload = {"data": {"repository": repository}}
+        if errors:
+            payload["errors"] = errors
+        mock_result = mocker.Mock()
+        mock_result.returncode = returncode
+        mock_result.stdout = json.dumps(payload).encode()
+        mock_result.stderr = b""
+        return mock_result
+
+    def test_fetches_all_issues_in_one_call(self, mocker):
+        """Should request all issues via aliases in a single gh call."""
+        repository = {
+            "i42": {"number": 42, "title": "First", "url": "https://github.com/org/repo/issues/42"},
+            "i43": {"number": 43, "title": "Second", "url": "https://github.com/org/repo/issues/43"},
+        }
+        mock_run = mocker.patch("subprocess.run", return_value=self._graphql_response(mocker, repository))
+
+        result = get_issues_batch("github.com", "testorg", "testrepo", [42, 43])
+
+        assert mock_run.call_count == 1
+        cmd = mock_run.call_args[0][0]
+        assert cmd[:3] == ["gh.sh", "api", "graphql"]
+        assert "owner=testorg" in cmd
+        assert "name=testrepo" in cmd
+        assert result[42]["html_url"] == "https://github.com/org/repo/issues/42"
+        assert result[43]["title"] == "Second"
+
+    def test_missing_issue_omitted(self, mocker):
+        """Should skip aliases that did not resolve even though gh exits non-zero."""
+        repository = {
+            "i42": {"number": 42, "title": "First", "url": "url42"},
+            "i999": None,
+        }
+        errors = [{"type": "NOT_FOUND", "message": "Could not resolve to an Issue with the number of 999."}]
+        mocker.patch(
+            "subprocess.run",
+            return_value=self._graphql_response(mocker, repository, returncode=1, errors=errors),
+        )
+        mock_get_issue = mocker.patch("notehub.gh_wrapper.get_issue", side_effect=GhError(1, "HTTP 404"))
+
+        result = get_issues_batch("github.com", "testorg", "testrepo", [42, 999])
+
+        assert list(result) == [42]
+        mock_get_issue.assert_called_once_with("github.com", "testorg", "testrepo", 999)
+
+    def test_unresolved_alias_falls_back_to_rest(self, mocker):
+        """Should fetch numbers GraphQL can't resolve (e.g. pull requests) via get_issue."""
+        repository = {"i42": {"number": 42, "title": "First", "url": "url42"}, "i7": None}
+        errors = [{"type": "NOT_FOUND", "message": "Could not resolve to an Issue with the number of 7."}]
+        mocker.patch(
+            "subprocess.run",
+            return_value=self._graphql_response(mocker, repository, returncode=1, errors=errors),
+        )
+        pull = {"number": 7, "title": "A pull request", "html_url": "url7", "body": ""}
+        mocker.patch("notehub.gh_wrapper.get_issue", return_value=pull)
+
+        result = get_issues_batch("github.com", "testorg", "testrepo", [42, 7])
+
+        assert result[7] == pull
+        assert result[42]["html_url"] == "url42"
+
+    def test_graphql_error_without_data_falls_back_to_rest(self, mocker):
+        """Should fetch the whole batch via get_issue when the query itself is rejected."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 1
+        mock_result.stdout = json.dumps({"errors": [{"message": "Field 'issue' doesn't exist"}]}).encode()
+        mock_result.stderr = b""
+        mocker.patch("subprocess.run", return_value=mock_result)
+        mock_get_issue = mocker.patch(
+            "notehub.gh_wrapper.get_issue",
+            side_effect=lambda host, org, repo, n: {"number": n, "title": f"Issue {n}", "html_url": f"url{n}"},
+        )
+
+        result = get_issues_batch("github.com", "testorg", "testrepo", [1, 2])
+
+        assert sorted(result) == [1, 2]
+        assert mock_get_issue.call_count == 2
+
+    def test_http_error_raises(self, mocker):
+        """Should raise rather than fall back when the request itself was refused."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 1
+        mock_result.stdout = json.dumps({"message": "Bad credentials"}).encode()
+        mock_result.stderr = b"gh: Bad credentials (HTTP 401)"
+        mocker.patch("subprocess.run", return_value=mock_result)
+        mock_get_issue = mocker.patch("notehub.gh_wrapper.get_issue")
+
+        with pytest.raises(GhError) as exc_info:
+            get_issues_batch("github.com", "testorg", "testrepo", [1, 2])
+
+        assert "Bad credentials" in exc_info.value.stderr
+        mock_get_issue.assert_not_called()
+
+    def test_chunks_large_requests(self, mocker):
+        """Should split requests into batches of GRAPHQL_BATCH_SIZE."""
+        mock_run = mocker.patch(
+            "subprocess.run", side_effect=lambda *args, **kwargs: self._graphql_response(mocker, {})
+        )
+        mocker.patch("notehub.gh_wrapper.get_issue", side_effect=GhError(1, "HTTP 404"))
+
+        get_issues_batch("github.com", "testorg", "testrepo", list(range(1, 46)))
+
+        assert mock_run.call_count == 3
+
+    def test_missing_repository_raises(self, mocker):
+        """Should raise GhError when the repository itself cannot be resolved."""
+        errors = [{"type": "NOT_FOUND", "message": "Could not resolve to a Repository"}]
+        mocker.patch(
+            "subprocess.run",
+            return_value=self._graphql_response(mocker, None, returncode=1, errors=errors),
+        )
+
+        with pytest.raises(GhError) as exc_info:
+            get_issues_batch("github.com", "testorg", "missing", [1, 2])
+
+        assert "Could not resolve to a Repository" in exc_info.value.stderr
+
+    def test_command_failure_without_output(self, mocker):
+        """Should raise GhError with gh's stderr when nothing was returned."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 1
+        mock_result.stdout = b""
+        mock_result.stderr = b"HTTP 401: Bad credentials"
+        mocker.patch("subprocess.run", return_value=mock_result)
+
+        with pytest.raises(GhError) as exc_info:
+            get_issues_batch("github.com", "testorg", "testrepo", [1, 2])
+
+        assert "Bad credentials" in exc_info.value.stderr
+
+    def test_fallback_results_keep_request_order(self, mocker):
+        """Should return concurrently fetched fallbacks in the order requested."""
+        mocker.patch("subprocess.run", return_value=self._graphql_response(mocker, {}))
+        mocker.patch(
+            "notehub.gh_wrapper.get_issue",
+            side_effect=lambda host, org, repo, n: {"number": n, "title": f"Issue {n}", "html_url": f"url{n}"},
+        )
+
+        result = get_issues_batch("github.com", "testorg", "testrepo", [5, 3, 9, 1])
+
+        assert list(result) == [5, 3, 9, 1]
+
+    def test_fallback_omits_only_missing_issues(self, mocker):
+        """Should drop numbers REST reports as not found."""
+        mocker.patch("subprocess.run", return_value=self._graphql_response(mocker, {}))
+        mocker.patch("notehub.gh_wrapper.get_issue", side_effect=GhError(1, "gh: Not Found (HTTP 404)"))
+
+        assert get_issues_batch("github.com", "testorg", "testrepo", [7]) == {}
+
+    @pytest.mark.parametrize(
+        "stderr",
+        ["API rate limit exceeded", "HTTP 403: Resource not accessible (repos/testorg/testrepo/issues/404)"],
+    )
+    def test_fallback_propagates_other_errors(self, mocker, stderr):
+        """Should raise auth, network and rate-limit failures instead of treating them as missing."""
+        mocker.patch("subprocess.run", return_value=self._graphql_response(mocker, {}))
+        mocker.patch("notehub.gh_wrapper.get_issue", side_effect=GhError(1, stderr))
+
+        with pytest.raises(GhError) as exc_info:
+            get_issues_batch("github.com", "testorg", "testrepo", [7])
+
+        assert exc_info.value.stderr == stderr
+
+
+class TestTtlCache:
+    """Tests for _ttl_cache decorator."""
+
+    def test_reuses_result_until_expiry(self, mocker):
+        """Should serve cached results until the TTL passes."""
+        clock = mocker.patch("notehub.gh_wrapper.time.monotonic", return_value=100.0)
+        fetch = mocker.Mock(side_effect=lambda n: n * 2)
+        cached = _ttl_cache(seconds=30)(fetch)
+
+        assert cached(1) == 2
+        clock.return_value = 129.0
+        assert cached(1) == 2
+        assert fetch.call_count == 1
+
+        clock.return_value = 131.0
+        assert cached(1) == 2
+        assert fetch.call_count == 2
+
+    def test_does_not_cache_exceptions(self, mocker):
+        """Should call again after a failure."""
+        fetch = mocker.Mock(side_effect=[GhError(1, "boom"), "ok"])
+        cached = _ttl_cache(seconds=30)(fetch)
+
+        with pytest.raises(GhError):
+            cached("key")
+        assert cached("key") == "ok"
+
+    def test_evict_drops_single_entry(self, mocker):
+        """Should refetch only the evicted key."""
+        fetch = mocker.Mock(side_effect=lambda n: n)
+        cached = _ttl_cache(seconds=30)(fetch)
+        cached(1)
+        cached(2)
+
+        cached.cache_evict(1)
+        cached(1)
+        cached(2)
+
+        assert [c.args for c in fetch.call_args_list] == [(1,), (2,), (1,)]
+
+    def test_drops_oldest_when_full(self, mocker):
+        """Should stay within maxsize by evicting the oldest entry."""
+        fetch = mocker.Mock(side_effect=lambda n: n)
+        cached = _ttl_cache(seconds=30, maxsize=2)(fetch)
+        cached(1)
+        cached(2)
+        cached(3)
+
+        cached(2)
+        cached(1)
+
+        assert [c.args for c in fetch.call_args_list] == [(1,), (2,), (3,), (1,)]
+
+
+class TestMapConcurrently:
+    """Tests for _map_concurrently helper."""
+
+    def test_preserves_order(self):
+        """Should return results in input order."""
+        assert _map_concurrently(lambda n: n * 2, [3, 1, 2]) == [6, 2, 4]
+
+    def test_single_item_runs_inline(self, mocker):
+        """Should not start a thread pool for a single call."""
+        mock_pool = mocker.patch("concurrent.futures.ThreadPoolExecutor")
+
+        assert _map_concurrently(lambda n: n + 1, [1]) == [2]
+        mock_pool.assert_not_called()
+
+    def test_propagates_errors(self):
+        """Should re-raise an exception from any call."""
+
+        def fail_on_two(n):
+            if n == 2:
+                raise GhError(1, "boom")
+            return n
+
+        with pytest.raises(GhError):
+            _map_concurrently(fail_on_two, [1, 2, 3])
+
 
 class TestListIssues:
     """Tests for list_issues function."""
@@ -139,8 +457,8 @@ class TestListIssues:
         """Should fetch and parse list of issues."""
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = json.dumps(sample_gh_issue_list)
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps(sample_gh_issue_list).encode()
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = list_issues("github.com", "testorg", "testrepo")
@@ -153,8 +471,8 @@ class TestListIssues:
         """Should return empty list when no issues found."""
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "[]"
-        mock_result.stderr = ""
+        mock_result.stdout = b"[]"
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = list_issues("github.com", "testorg", "testrepo")
@@ -165,8 +483,8 @@ class TestListIssues:
         """Should use custom fields parameter."""
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = '[{"number": 1, "title": "Test"}]'
-        mock_result.stderr = ""
+        mock_result.stdout = b'[{"number": 1, "title": "Test"}]'
+        mock_result.stderr = b""
         mock_run = mocker.patch("subprocess.run", return_value=mock_result)
 
         list_issues("github.com", "testorg", "testrepo", fields="number,title")
@@ -181,8 +499,8 @@ class TestListIssues:
         """Should raise GhError on failure."""
         mock_result = mocker.Mock()
         mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "API error"
+        mock_result.stdout = b""
+        mock_result.stderr = b"API error"
         mocker.patch("subprocess.run", return_value=mock_result)
 
         with pytest.raises(GhError) as exc_info:
@@ -218,6 +536,73 @@ class TestCheckGhAuth:
 
         assert result is False
 
+    def test_auth_cached_per_host(self, mocker):
+        """Should run gh once per host within a process."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = ""
+        mock_result.stderr = ""
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        check_gh_auth("github.com")
+        check_gh_auth("github.com")
+        check_gh_auth("github.example.com")
+
+        assert mock_run.call_count == 2
+
+
+class TestGetAuthState:
+    """Tests for get_auth_state function."""
+
+    def test_authenticated_returns_login(self, mocker):
+        """Should report auth and username from one gh api user call."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 0
+        mock_result.stdout = "testuser\n"
+        mock_result.stderr = ""
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        assert get_auth_state("github.com") == (True, "testuser")
+        assert get_gh_user("github.com") == "testuser"
+        assert check_gh_auth("github.com") is True
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["gh.sh", "api", "user", "--jq", ".login"]
+
+    def test_not_authenticated(self, mocker, capsys):
+        """Should return (False, None) and pass gh's error through."""
+        mock_result = mocker.Mock()
+        mock_result.returncode = 1
+        mock_result.stdout = ""
+        mock_result.stderr = "gh: To get started with GitHub CLI, please run: gh auth login\n"
+        mocker.patch("subprocess.run", return_value=mock_result)
+
+        assert get_auth_state("github.com") == (False, None)
+        assert "gh auth login" in capsys.readouterr().err
+
+    def test_failure_not_cached(self, mocker):
+        """Should check again after a failure instead of serving it from the cache."""
+        failed = mocker.Mock(returncode=1, stdout="", stderr="")
+        ok = mocker.Mock(returncode=0, stdout="testuser\n", stderr="")
+        mock_run = mocker.patch("subprocess.run", side_effect=[failed, ok])
+
+        assert get_auth_state("github.com") == (False, None)
+        assert get_auth_state("github.com") == (True, "testuser")
+        assert mock_run.call_count == 2
+
+    def test_token_change_rechecks(self, mocker, mock_env):
+        """Should not reuse a cached result once a token variable changes."""
+        mock_env({})
+        ok = mocker.Mock(returncode=0, stdout="testuser\n", stderr="")
+        mock_run = mocker.patch("subprocess.run", return_value=ok)
+
+        get_auth_state("github.com")
+        get_auth_state("github.com")
+        mocker.patch.dict("os.environ", {"GH_TOKEN": "new-token"})
+        get_auth_state("github.com")
+
+        assert mock_run.call_count == 2
+
 
 class TestGetGhUser:
     """Tests for get_gh_user function."""
@@ -314,6 +699,34 @@ class TestCreateIssue:
         call_kwargs = mock_run.call_args[1]
         assert call_kwargs["capture_output"] is True
 
+    def test_create_issue_non_interactive_passes_title_and_body(self, mocker):
+        """Should pass title/body to gh and return the new issue URL."""
+        from notehub.gh_wrapper import create_issue
+
+        mock_result = mocker.Mock(returncode=0, stdout="https://github.com/testorg/testrepo/issues/42\n", stderr="")
+        mock_run = mocker.patch("subprocess.run", return_value=mock_result)
+
+        result = create_issue(
+            "github.com", "testorg", "testrepo", interactive=False, labels=["notehub"], title="T", body="B"
+        )
+
+        assert result.stdout == "https://github.com/testorg/testrepo/issues/42"
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--title") + 1] == "T"
+        assert cmd[cmd.index("--body") + 1] == "B"
+
+    def test_create_issue_non_interactive_failure_keeps_stderr(self, mocker):
+        """Should raise GhError carrying gh's stderr."""
+        from notehub.gh_wrapper import GhError, create_issue
+
+        mock_result = mocker.Mock(returncode=1, stdout="", stderr="HTTP 403: forbidden")
+        mocker.patch("subprocess.run", return_value=mock_result)
+
+        with pytest.raises(GhError) as exc_info:
+            create_issue("github.com", "testorg", "testrepo", interactive=False, title="T")
+
+        assert "forbidden" in exc_info.value.stderr
+
     def test_create_issue_with_labels(self, mocker):
         """Should include labels in command."""
         from notehub.gh_wrapper import create_issue
@@ -358,8 +771,8 @@ class TestEnsureLabelExists:
 
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = '{"name": "notehub", "color": "FFC107"}'
-        mock_result.stderr = ""
+        mock_result.stdout = b'{"name": "notehub", "color": "FFC107"}'
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = ensure_label_exists("github.com", "testorg", "testrepo", "notehub", "FFC107", "Notehub label")
@@ -377,8 +790,8 @@ class TestEnsureLabelExists:
                 "message": "Validation Failed",
                 "errors": [{"code": "already_exists", "field": "name"}],
             }
-        )
-        mock_result.stderr = ""
+        ).encode()
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = ensure_label_exists("github.com", "testorg", "testrepo", "notehub", "FFC107")
@@ -391,8 +804,8 @@ class TestEnsureLabelExists:
 
         mock_result = mocker.Mock()
         mock_result.returncode = 1
-        mock_result.stdout = json.dumps({"message": "API rate limit exceeded"})
-        mock_result.stderr = ""
+        mock_result.stdout = json.dumps({"message": "API rate limit exceeded"}).encode()
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = ensure_label_exists("github.com", "testorg", "testrepo", "notehub", "FFC107")
@@ -405,8 +818,8 @@ class TestEnsureLabelExists:
 
         mock_result = mocker.Mock()
         mock_result.returncode = 1
-        mock_result.stdout = "Invalid JSON response"
-        mock_result.stderr = ""
+        mock_result.stdout = b"Invalid JSON response"
+        mock_result.stderr = b""
         mocker.patch("subprocess.run", return_value=mock_result)
 
         result = ensure_label_exists("github.com", "testorg", "testrepo", "notehub", "FFC107")
@@ -517,6 +930,17 @@ class TestRunGhCommand:
         # Should not pass errors='replace' in passthrough mode
         assert "errors" not in mock_run.call_args[1]
 
+    def test_bytes_mode_decodes_only_stderr(self, mocker):
+        """Should leave stdout as bytes and decode stderr when text=False."""
+        mock_run = mocker.patch("notehub.gh_wrapper.subprocess.run")
+        mock_run.return_value = mocker.Mock(returncode=1, stdout=b'{"key": "value"}', stderr=b"bad \xff")
+
+        result = _run_gh_command(["gh", "api", "user"], {}, "github.com", text=False)
+
+        assert result.stdout == b'{"key": "value"}'
+        assert result.stderr == "bad �"
+        assert "text" not in mock_run.call_args[1]
+
 
 class TestListIssuesErrorHandling:
     """Tests for list_issues error handling."""
@@ -527,7 +951,7 @@ class TestListIssuesErrorHandling:
         mock_result = mocker.Mock()
         mock_result.returncode = 0
         mock_result.stdout = None
-        mock_result.stderr = ""
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         with pytest.raises(GhError):
@@ -542,8 +966,8 @@ class TestListIssuesErrorHandling:
         mock_run = mocker.patch("notehub.gh_wrapper.subprocess.run")
         mock_result = mocker.Mock()
         mock_result.returncode = 0
-        mock_result.stdout = "not valid json"
-        mock_result.stderr = ""
+        mock_result.stdout = b"not valid json"
+        mock_result.stderr = b""
         mock_run.return_value = mock_result
 
         with pytest.raises(GhError):
@@ -96,6 +96,45 @@ class TestResolveNoteIdent:
         assert issue_num is None
         assert "Failed to list issues: API rate limit exceeded" in error
 
+    def test_title_regex_uses_prefetched_issues(self, mocker):
+        """Should match against all_issues without calling list_issues."""
+        context = StoreContext(host="github.com", org="testorg", repo="testrepo")
+        mock_list = mocker.patch("notehub.utils.list_issues")
+
+        issue_num, error = resolve_note_ident(
+            context, "dashboard", all_issues=[{"number": 11, "title": "Feature request for dashboard"}]
+        )
+
+        assert issue_num == 11
+        assert error is None
+        mock_list.assert_not_called()
+
+    def test_plain_substring_skips_regex(self, mocker):
+        """Should match metachar-free idents as case-insensitive substrings without compiling."""
+        context = StoreContext(host="github.com", org="testorg", repo="testrepo")
+        mock_compile = mocker.patch("notehub.utils.re.compile")
+
+        issue_num, error = resolve_note_ident(
+            context, "LOGIN", all_issues=[{"number": 10, "title": "Bug in login form"}]
+        )
+
+        assert issue_num == 10
+        assert error is None
+        mock_compile.assert_not_called()
+
+    def test_metacharacters_use_regex(self, mocker):
+        """Should treat idents containing regex metacharacters as patterns."""
+        context = StoreContext(host="github.com", org="testorg", repo="testrepo")
+        all_issues = [
+            {"number": 10, "title": "Bug in login form"},
+            {"number": 11, "title": "bug.*login literal"},
+        ]
+
+        issue_num, error = resolve_note_ident(context, "^bug in", all_issues=all_issues)
+
+        assert issue_num == 10
+        assert error is None
+
 
 class TestFormatNoteHeader:
     """Tests for format_note_header function."""